@@ -4,15 +4,21 @@ Configuration file for Sales Visualization Tool
 import os
 
 # Project paths
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'output')
-CHARTS_DIR = os.path.join(OUTPUT_DIR, 'charts')
-REPORTS_DIR = os.path.join(OUTPUT_DIR, 'reports')
+# __file__ is already absolute when imported normally, so normpath (a pure string
+# operation) is enough; only fall back to abspath, which also calls getcwd, when
+# run with a relative path
+_CONFIG_FILE = os.path.normpath(__file__) if os.path.isabs(__file__) else os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(_CONFIG_FILE)
+# PROJECT_ROOT is already absolute and normalized, so plain concatenation is enough
+DATA_DIR = PROJECT_ROOT + os.sep + 'data'
+OUTPUT_DIR = PROJECT_ROOT + os.sep + 'output'
+CHARTS_DIR = OUTPUT_DIR + os.sep + 'charts'
+REPORTS_DIR = OUTPUT_DIR + os.sep + 'reports'
+CACHE_DIR = OUTPUT_DIR + os.sep + 'cache'
 
 # Data file settings
-SAMPLE_DATA_FILE = os.path.join(DATA_DIR, 'sample_sales_data.csv')
-DEFAULT_DATA_FILE = os.path.join(DATA_DIR, 'sales_data.csv')
+SAMPLE_DATA_FILE = DATA_DIR + os.sep + 'sample_sales_data.csv'
+DEFAULT_DATA_FILE = DATA_DIR + os.sep + 'sales_data.csv'
 
 # Chart settings
 CHART_THEME = 'plotly_white'  # plotly themes: plotly, plotly_white, plotly_dark, ggplot2, seaborn, simple_white
@@ -2,16 +2,24 @@
 Setup script for Sales Visualization Tool
 Run this to set up the complete project structure and install dependencies
 """
+import importlib.util
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# Compile bytecode at install time so the first run doesn't pay for it, and keep
+# downloaded wheels in a persistent cache (override with PIP_CACHE_DIR)
+PIP_CACHE_DIR = os.environ.get('PIP_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'pip'))
+PIP_COMMAND = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--prefer-binary',
+               '--compile', '--cache-dir', PIP_CACHE_DIR]
+
 def create_directory_structure():
     """Create the complete directory structure"""
+    # Leaf directories only: parents=True creates 'output' along with its children
     directories = [
         'data',
-        'output',
         'output/charts',
         'output/reports',
         'src',
@@ -20,7 +28,11 @@ def create_directory_structure():
     ]
     
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        path = Path(directory)
+        if path.is_dir():
+            print(f"✓ Directory exists: {directory}")
+            continue
+        path.mkdir(parents=True, exist_ok=True)
         print(f"✓ Created directory: {directory}")
     
     # Create __init__.py files
@@ -30,9 +42,59 @@ def create_directory_structure():
     ]
     
     for init_file in init_files:
-        Path(init_file).touch(exist_ok=True)
+        path = Path(init_file)
+        if path.exists():
+            print(f"✓ File exists: {init_file}")
+            continue
+        path.touch()
         print(f"✓ Created file: {init_file}")
 
+def get_installer_command():
+    """
+    Return the base install command, preferring uv over pip
+
+    uv is bootstrapped through pip when it is not on PATH. Set UV_CACHE_DIR
+    to a persistent location (e.g. in CI) to reuse downloaded wheels.
+    """
+    uv_args = ['pip', 'install', '--python', sys.executable, '--compile-bytecode']
+    uv = shutil.which('uv')
+    if uv is not None:
+        return [uv] + uv_args
+    
+    # A pip-installed uv is run as a module, since pip may put its script in a
+    # directory that is not on PATH (--user installs, venvs that are not activated)
+    if importlib.util.find_spec('uv') is None:
+        try:
+            subprocess.check_call(PIP_COMMAND + ['uv'])
+        except subprocess.CalledProcessError as e:
+            print(f"⚠ Could not install uv ({e}), falling back to pip")
+            return PIP_COMMAND
+        importlib.invalidate_caches()
+    return [sys.executable, '-m', 'uv'] + uv_args
+
+def filter_missing_packages(packages):
+    """Return the requirements that are not installed or do not satisfy their version specifier"""
+    try:
+        from importlib import metadata
+        from packaging.requirements import Requirement
+    except ImportError:
+        # Without packaging we cannot check specifiers, so install everything
+        return list(packages)
+    
+    missing = []
+    for package in packages:
+        requirement = Requirement(package)
+        try:
+            installed_version = metadata.version(requirement.name)
+        except metadata.PackageNotFoundError:
+            missing.append(package)
+            continue
+        
+        if not requirement.specifier.contains(installed_version, prereleases=True):
+            missing.append(package)
+    
+    return missing
+
 def install_dependencies():
     """Install required Python packages"""
     packages = [
@@ -50,15 +112,51 @@ def install_dependencies():
         'dash-bootstrap-components>=1.4.0'
     ]
     
-    print("Installing Python packages...")
+    packages = filter_missing_packages(packages)
+    if not packages:
+        print("✓ All dependencies satisfied")
+        return
     
+    print("Installing Python packages...")
+    installer = get_installer_command()
+
+    # Install everything in one run so the resolver sees all requirements at once
+    try:
+        subprocess.check_call(installer + packages)
+        for package in packages:
+            print(f"✓ Installed: {package}")
+        return
+    except subprocess.CalledProcessError as e:
+        print(f"⚠ Batch install failed ({e}), retrying packages individually with pip...")
+
     for package in packages:
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+            subprocess.check_call(PIP_COMMAND + [package])
             print(f"✓ Installed: {package}")
         except subprocess.CalledProcessError as e:
             print(f"✗ Failed to install {package}: {e}")
 
+def write_if_changed(path, content):
+    """
+    Write content to path unless the file already holds exactly that content
+    
+    Skipping identical writes keeps the file's mtime stable for tools that
+    track changes by timestamp.
+    
+    Returns:
+        bool: True if the file was written
+    """
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
 def create_configuration_files():
     """Create additional configuration files"""
     
@@ -115,9 +213,10 @@ data/large_files/
 .ipynb_checkpoints/
 """
     
-    with open('.gitignore', 'w') as f:
-        f.write(gitignore_content)
-    print("✓ Created .gitignore")
+    if write_if_changed('.gitignore', gitignore_content):
+        print("✓ Created .gitignore")
+    else:
+        print("✓ .gitignore is up to date")
     
     # Create environment.yml for conda users
     conda_env = """
@@ -143,9 +242,10 @@ dependencies:
     - dash-bootstrap-components>=1.4.0
 """
     
-    with open('environment.yml', 'w') as f:
-        f.write(conda_env)
-    print("✓ Created environment.yml")
+    if write_if_changed('environment.yml', conda_env):
+        print("✓ Created environment.yml")
+    else:
+        print("✓ environment.yml is up to date")
 
 def create_batch_scripts():
     """Create batch scripts for easy execution"""
@@ -157,9 +257,10 @@ python main.py
 pause
 """
     
-    with open('run_tool.bat', 'w') as f:
-        f.write(windows_script)
-    print("✓ Created run_tool.bat (Windows)")
+    if write_if_changed('run_tool.bat', windows_script):
+        print("✓ Created run_tool.bat (Windows)")
+    else:
+        print("✓ run_tool.bat (Windows) is up to date")
     
     # Linux/Mac shell script
     shell_script = """#!/bin/bash
@@ -168,8 +269,9 @@ python main.py
 read -p "Press enter to continue..."
 """
     
-    with open('run_tool.sh', 'w') as f:
-        f.write(shell_script)
+    if not write_if_changed('run_tool.sh', shell_script):
+        print("✓ run_tool.sh (Linux/Mac) is up to date")
+        return
     
     # Make shell script executable
     try:
@@ -194,17 +296,23 @@ def verify_installation():
     # Check required packages
     required_packages = ['pandas', 'matplotlib', 'seaborn', 'plotly', 'numpy', 'openpyxl']
     
+    # find_spec only locates the package; importing it would execute pandas/plotly
+    missing_packages = {package for package in required_packages
+                        if importlib.util.find_spec(package) is None}
     for package in required_packages:
-        try:
-            __import__(package)
+        if package not in missing_packages:
             print(f"✓ {package} is available")
-        except ImportError:
+        else:
             print(f"✗ {package} is NOT available")
     
-    # Check directory structure
+    if missing_packages:
+        print(f"⚠ Missing packages: {', '.join(sorted(missing_packages))}")
+    
+    # Check directory structure with a single directory listing
     required_dirs = ['data', 'output', 'src', 'examples']
+    existing_dirs = {entry.name for entry in os.scandir('.') if entry.is_dir()}
     for directory in required_dirs:
-        if os.path.exists(directory):
+        if directory in existing_dirs:
             print(f"✓ Directory exists: {directory}")
         else:
             print(f"✗ Directory missing: {directory}")
@@ -2,32 +2,415 @@
 Custom dashboard creation example
 This shows how to create specialized dashboards for different use cases
 """
+import importlib.util
 import sys
 import os
+import weakref
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from sales_analyzer import SalesVisualizationTool
-from visualizations import ChartGenerator
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
-class ExecutiveDashboard:
-    """Executive-level dashboard with KPIs and high-level metrics"""
+from utils import HAS_NUMBA, NUMBA_MIN_ROWS, FrameCache, compiled, group_counts, group_stats, group_sums, \
+    top_k, top_k_positions
+
+# Plotly is bound on first use by _lazy_plotly() so importing this module stays cheap
+go = None
+make_subplots = None
+
+def _lazy_plotly():
+    """
+    Import plotly on first use and bind it to the module globals
     
-    def __init__(self, data):
+    Figures are serialized with orjson when it is installed, which encodes
+    the numpy arrays passed to the traces in C.
+    """
+    global go, make_subplots
+    if go is None:
+        import plotly.graph_objects as _go
+        import plotly.io as pio
+        from plotly.subplots import make_subplots as _make_subplots
+        if importlib.util.find_spec('orjson') is not None:
+            pio.json.config.default_engine = 'orjson'
+        make_subplots = _make_subplots
+        go = _go
+
+# Above this many points, line traces switch to WebGL (Scattergl)
+WEBGL_THRESHOLD = 5_000
+
+# Above this many points, scatter plots are pre-rasterized with datashader (if installed)
+RASTERIZE_THRESHOLD = 100_000
+
+# Only the top products by sales get a drawn label; the rest are labelled on hover
+MAX_POINT_LABELS = 20
+
+# Remaining string columns (e.g. Customer_ID) are stored as Arrow strings when
+# pyarrow is installed, which factorize encodes in C++ instead of hashing objects
+ARROW_STRINGS = importlib.util.find_spec('pyarrow') is not None
+
+# Line traces longer than this are downsampled with LTTB to LTTB_TARGET points
+LTTB_THRESHOLD = 2_000
+LTTB_TARGET = 1_000
+
+def _lttb_numpy(x, y, target):
+    """Largest-Triangle-Three-Buckets selection, vectorized within each bucket"""
+    n = x.size
+    every = (n - 2) / (target - 2)
+    indices = np.empty(target, np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(target - 2):
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        start = int(i * every) + 1
+        areas = np.abs((x[a] - avg_x) * (y[start:next_start] - y[a])
+                       - (x[a] - x[start:next_start]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
+
+def _lttb_loop(x, y, target):
+    """Largest-Triangle-Three-Buckets selection in a single pass"""
+    n = x.size
+    every = (n - 2) / (target - 2)
+    indices = np.empty(target, np.int64)
+    indices[0] = 0
+    indices[target - 1] = n - 1
+    
+    a = 0
+    for i in range(target - 2):
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(next_start, next_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= next_end - next_start
+        avg_y /= next_end - next_start
+        
+        best = -1.0
+        best_index = next_start - 1
+        for j in range(int(i * every) + 1, next_start):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best:
+                best = area
+                best_index = j
+        a = best_index
+        indices[i + 1] = a
+    
+    return indices
+
+def downsample_lttb(x, y, target=LTTB_TARGET, threshold=LTTB_THRESHOLD):
+    """
+    Downsample a line series with Largest-Triangle-Three-Buckets
+    
+    Keeps the first and last points plus the point of each bucket that spans
+    the largest triangle with its neighbours, so peaks and troughs survive.
+    Series of at most `threshold` points are returned unchanged.
+    
+    Args:
+        x (array-like): Sorted x values (numeric or datetime64)
+        y (array-like): y values
+        target (int): Number of points to keep
+        threshold (int): Minimum length before downsampling kicks in
+        
+    Returns:
+        tuple: (x, y) numpy arrays
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if x.size <= max(threshold, target) or target < 3:
+        return x, y
+    
+    x_numeric = (x.view(np.int64) if x.dtype.kind == 'M' else x).astype(np.float64)
+    y_numeric = y.astype(np.float64)
+    if HAS_NUMBA and x.size >= NUMBA_MIN_ROWS:
+        indices = compiled(_lttb_loop)(x_numeric, y_numeric, target)
+    else:
+        indices = _lttb_numpy(x_numeric, y_numeric, target)
+    return x[indices], y[indices]
+
+class _SharedData:
+    """Prepared data, aggregation cache and ChartGenerator for one source DataFrame"""
+    
+    def __init__(self, source):
+        self.source = weakref.ref(source)
+        self.data = None
+        self.agg_cache = None
+        self.chart_gen = None
+
+# Dashboards built on the same DataFrame share one _SharedData, keyed by id() of
+# the source frame; entries disappear once no dashboard references them
+_shared_data = weakref.WeakValueDictionary()
+
+class CachedAggregationMixin:
+    """
+    Memoize groupby aggregations so dashboard panels share a single pass per key
+    
+    Results are cached per (group key, value column, aggregation) and shared
+    by every dashboard created from the same DataFrame. The cache is dropped
+    whenever self.data is reassigned.
+    """
+    
+    # Group keys stored as categoricals so groupby works on integer codes
+    CATEGORICAL_COLUMNS = ('Product', 'Region', 'Sales_Rep')
+    
+    def _set_data(self, data):
+        """Store data with categorical group keys and precompute its month periods"""
+        shared = _shared_data.get(id(data))
+        if shared is not None and shared.source() is data:
+            self._shared = shared
+            self.data = shared.data
+            self._agg_cache = shared.agg_cache
+            return self.data
+        
+        source = data
+        to_convert = {col: data[col].astype('category') for col in self.CATEGORICAL_COLUMNS
+                      if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype)}
+        if ARROW_STRINGS:
+            to_convert.update({col: data[col].astype('string[pyarrow]') for col in data.columns
+                               if col not in to_convert and data[col].dtype == object
+                               and pd.api.types.infer_dtype(data[col], skipna=True) == 'string'})
+        if to_convert:
+            data = data.assign(**to_convert)
+        
         self.data = data
-        self.chart_gen = ChartGenerator(data)
+        self._reset_agg_cache()
+        
+        shared = _SharedData(source)
+        shared.data, shared.agg_cache = data, self._agg_cache
+        _shared_data[id(source)] = shared
+        self._shared = shared
+        return data
+    
+    def _reset_agg_cache(self):
+        """Drop cached aggregations"""
+        self._agg_cache = FrameCache(self.data)
+    
+    def _check_agg_cache(self):
+        """Drop cached aggregations if self.data was reassigned since they were computed"""
+        if getattr(self, '_agg_cache', None) is None or not self._agg_cache.is_for(self.data):
+            self._reset_agg_cache()
+    
+    def _agg(self, by, col='Total_Sales', how='sum'):
+        """
+        Return self.data grouped by `by` with `col` aggregated using `how`
+        
+        Args:
+            by (str or tuple): Column(s) to group by, or 'M' for calendar months of Date
+            col (str): Value column to aggregate (ignored for how='size')
+            how (str): Aggregation name, e.g. 'sum', 'nunique' or 'size'
+            
+        Returns:
+            pd.Series: Aggregated values indexed by group
+        """
+        self._check_agg_cache()
+        
+        key = (by, col, how)
+        if key in self._agg_cache:
+            return self._agg_cache[key]
+        
+        if isinstance(by, str) and by not in ('M', 'Date') and how in ('sum', 'size', 'nunique'):
+            # Single unordered key: reduce over the integer codes directly
+            self._agg_cache[key] = self._reduce_by(by, col, how)
+            return self._agg_cache[key]
+        
+        if by == 'M':
+            grouper = self._month_periods()
+        elif isinstance(by, tuple):
+            grouper = list(by)
+        else:
+            grouper = by
+        
+        # Time-based keys must stay in order for line charts; the others
+        # skip the post-group sort
+        keep_order = by == 'M' or 'Date' in (by if isinstance(by, tuple) else (by,))
+        grouped = self.data.groupby(grouper, observed=True, sort=keep_order)
+        if how == 'size':
+            self._agg_cache[key] = grouped.size()
+        else:
+            self._agg_cache[key] = grouped[col].agg(how)
+        
+        return self._agg_cache[key]
+    
+    def _month_periods(self):
+        """Calendar month of each Date as a Period, computed on first use and cached with the aggregations"""
+        key = ('Date', None, 'month_period')
+        if key not in self._agg_cache:
+            self._agg_cache[key] = self.data['Date'].dt.to_period('M')
+        return self._agg_cache[key]
+    
+    def _group_codes(self, by):
+        """Integer codes (-1 for missing) and labels of a group column, factorized once"""
+        keys = self.data[by]
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            return keys.cat.codes.to_numpy(), keys.cat.categories
+        
+        key = (by, None, 'codes')
+        if key not in self._agg_cache:
+            self._agg_cache[key] = pd.factorize(keys, sort=False)
+        return self._agg_cache[key]
+    
+    def _sales_totals(self):
+        """
+        Whole-dataset KPIs shared by the gauge panels, computed once
+        
+        Returns:
+            dict: 'sum' and 'mean' of Total_Sales (NaN-skipping), row count 'n'
+                and distinct 'customers' (None without a Customer_ID column)
+        """
+        self._check_agg_cache()
+        
+        key = (None, 'Total_Sales', 'totals')
+        if key not in self._agg_cache:
+            sales = self.data['Total_Sales'].to_numpy(dtype=np.float64)
+            present = ~np.isnan(sales)
+            total = float(sales[present].sum())
+            n_present = int(np.count_nonzero(present))
+            customers = None
+            if 'Customer_ID' in self.data.columns:
+                # Only codes that occur count: a filtered frame keeps every category
+                codes, labels = self._group_codes('Customer_ID')
+                customers = int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(labels))))
+            self._agg_cache[key] = {
+                'sum': total,
+                'mean': total / n_present if n_present else float('nan'),
+                'n': len(sales),
+                'customers': customers
+            }
+        return self._agg_cache[key]
+    
+    def _reduce_by(self, by, col, how):
+        """
+        Sum, count or distinct-count `col` per value of a single column
+        
+        Works on the integer group codes with np.bincount (and group_stats
+        for distinct counts) instead of going through pandas' groupby.
+        Unobserved groups are dropped, matching groupby(observed=True).
+        """
+        codes, labels = self._group_codes(by)
+        n_groups = len(labels)
+        counts = group_counts(codes, n_groups)
+        
+        if how == 'size':
+            values = counts
+        elif how == 'sum':
+            values = group_sums(codes, self.data[col].to_numpy(dtype=np.float64), n_groups)
+        else:
+            member_codes, members = self._group_codes(col)
+            _, _, values = group_stats(codes, np.zeros(len(codes)), member_codes, n_groups, len(members))
+        
+        observed = counts > 0
+        return pd.Series(values[observed], index=pd.Index(np.asarray(labels)[observed], name=by),
+                         name=None if how == 'size' else col)
+
+class PanelDashboard(CachedAggregationMixin):
+    """
+    Dashboard assembled from a registry of independently built panels
+    
+    Subclasses list their panels in PANELS as (title, subplot type, builder
+    method name) in row-major order; a builder of None marks a placeholder
+    panel. Only the panels that are actually shown run their builders, so
+    asking for a subset skips the aggregations behind the others.
+    """
+    
+    PANELS = []
+    GRID_COLS = 1
+    HEIGHT = 800
+    TITLE = "Dashboard"
+    
+    def __init__(self, data):
+        self._set_data(data)
+    
+    @property
+    def chart_gen(self):
+        """ChartGenerator for self.data, created on first access and shared across dashboards"""
+        shared = self._shared
+        if shared.chart_gen is None or shared.chart_gen.data is not self.data:
+            from visualizations import ChartGenerator
+            if shared.data is not self.data:
+                # self.data was reassigned, so it no longer belongs to the shared entry
+                return ChartGenerator(self.data)
+            shared.chart_gen = ChartGenerator(self.data)
+        return shared.chart_gen
+    
+    def build(self, include=None):
+        """
+        Build the dashboard figure
+        
+        Args:
+            include (list): Titles of the panels to show. By default every
+                panel is shown in the full grid layout; otherwise the chosen
+                panels are laid out compactly in registry order.
+                
+        Returns:
+            go.Figure: Dashboard figure
+        """
+        _lazy_plotly()
+        panels = self.PANELS
+        if include is not None:
+            panels = [panel for panel in self.PANELS if panel[0] in include]
+            if not panels:
+                raise ValueError(f"No panels match {include}")
+        
+        cols = min(self.GRID_COLS, len(panels))
+        rows = -(-len(panels) // cols)
+        full_rows = -(-len(self.PANELS) // self.GRID_COLS)
+        
+        specs = [[None] * cols for _ in range(rows)]
+        for position, (_, panel_type, _) in enumerate(panels):
+            specs[position // cols][position % cols] = {"type": panel_type}
+        
+        fig = make_subplots(rows=rows, cols=cols, specs=specs,
+                            subplot_titles=[title for title, _, _ in panels])
+        
+        for position, (_, _, builder) in enumerate(panels):
+            if builder is None:
+                continue
+            row, col = position // cols + 1, position % cols + 1
+            traces = getattr(self, builder)()
+            for trace in traces:
+                fig.add_trace(trace, row=row, col=col)
+            if any(isinstance(trace, go.Image) for trace in traces):
+                # Image traces reverse the y axis by default
+                fig.update_yaxes(autorange=True, row=row, col=col)
+        
+        fig.update_layout(height=int(self.HEIGHT * rows / full_rows), title_text=self.TITLE)
+        return fig
+
+class ExecutiveDashboard(PanelDashboard):
+    """Executive-level dashboard with KPIs and high-level metrics"""
+    
+    PANELS = [
+        ('Revenue Trend', 'scatter', '_panel_revenue_trend'),
+        ('Top Products', 'bar', '_panel_top_products'),
+        ('Regional Performance', 'pie', '_panel_regional_performance'),
+        ('Monthly Growth', 'bar', '_panel_monthly_growth'),
+        ('Sales Funnel', 'funnel', None),
+        ('Customer Segments', 'bar', None),
+        ('Performance Score', 'indicator', '_panel_performance_score'),
+        ('Market Share', 'pie', None),
+        ('Forecast', 'scatter', None),
+    ]
+    GRID_COLS = 3
+    HEIGHT = 1000
+    TITLE = "Executive Dashboard"
     
     def create_kpi_cards(self):
         """Create KPI cards for key metrics"""
+        _lazy_plotly()
+        totals = self._sales_totals()
         kpis = {
-            'Total Revenue': self.data['Total_Sales'].sum(),
-            'Average Order Value': self.data['Total_Sales'].mean(),
-            'Total Orders': len(self.data),
-            'Unique Customers': self.data['Customer_ID'].nunique() if 'Customer_ID' in self.data.columns else 'N/A'
+            'Total Revenue': totals['sum'],
+            'Average Order Value': totals['mean'],
+            'Total Orders': totals['n'],
+            'Unique Customers': totals['customers'] if totals['customers'] is not None else 'N/A'
         }
         
         # Create gauge charts for each KPI
@@ -61,215 +444,291 @@ class ExecutiveDashboard:
         fig.update_layout(height=600, title_text="Executive KPI Dashboard")
         return fig
     
-    def create_executive_summary(self):
+    def create_executive_summary(self, include=None):
         """Create comprehensive executive dashboard"""
-        fig = make_subplots(
-            rows=3, cols=3,
-            subplot_titles=['Revenue Trend', 'Top Products', 'Regional Performance',
-                          'Monthly Growth', 'Sales Funnel', 'Customer Segments',
-                          'Performance Score', 'Market Share', 'Forecast'],
-            specs=[[{"type": "scatter"}, {"type": "bar"}, {"type": "pie"}],
-                   [{"type": "bar"}, {"type": "funnel"}, {"type": "bar"}],
-                   [{"type": "indicator"}, {"type": "pie"}, {"type": "scatter"}]]
-        )
-        
-        # Revenue trend
-        daily_revenue = self.data.groupby('Date')['Total_Sales'].sum()
-        fig.add_trace(go.Scatter(x=daily_revenue.index, y=daily_revenue.values,
-                               mode='lines', name='Revenue'), row=1, col=1)
-        
-        # Top products
-        top_products = self.data.groupby('Product')['Total_Sales'].sum().nlargest(5)
-        fig.add_trace(go.Bar(x=top_products.index, y=top_products.values,
-                           name='Top Products'), row=1, col=2)
-        
-        # Regional performance
-        regional_sales = self.data.groupby('Region')['Total_Sales'].sum()
-        fig.add_trace(go.Pie(labels=regional_sales.index, values=regional_sales.values,
-                           name='Regional Sales'), row=1, col=3)
-        
-        # Monthly growth
-        monthly_data = self.data.groupby(pd.Grouper(key='Date', freq='M'))['Total_Sales'].sum()
-        fig.add_trace(go.Bar(x=[str(x) for x in monthly_data.index], y=monthly_data.values,
-                           name='Monthly Sales'), row=2, col=1)
-        
-        # Performance indicator
-        total_sales = self.data['Total_Sales'].sum()
+        return self.build(include)
+    
+    def _panel_revenue_trend(self):
+        daily_revenue = self._agg('Date')
+        dates, revenue = downsample_lttb(daily_revenue.index.to_numpy(), daily_revenue.to_numpy())
+        scatter = go.Scattergl if len(dates) > WEBGL_THRESHOLD else go.Scatter
+        return [scatter(x=dates, y=revenue, mode='lines', name='Revenue')]
+    
+    def _panel_top_products(self):
+        top_products = top_k(self._agg('Product'), 5)
+        return [go.Bar(x=top_products.index.to_numpy(), y=top_products.to_numpy(),
+                       name='Top Products')]
+    
+    def _panel_regional_performance(self):
+        regional_sales = self._agg('Region')
+        return [go.Pie(labels=regional_sales.index.to_numpy(), values=regional_sales.to_numpy(),
+                       name='Regional Sales')]
+    
+    def _panel_monthly_growth(self):
+        monthly_data = self._agg('M')
+        return [go.Bar(x=[str(x) for x in monthly_data.index], y=monthly_data.to_numpy(),
+                       name='Monthly Sales')]
+    
+    def _panel_performance_score(self):
+        total_sales = self._sales_totals()['sum']
         target_sales = total_sales * 1.1  # 10% above current
-        fig.add_trace(go.Indicator(
+        return [go.Indicator(
             mode="gauge+number+delta",
             value=total_sales,
             delta={'reference': target_sales},
             title={'text': "Sales vs Target"},
             gauge={'axis': {'range': [0, target_sales * 1.2]}}
-        ), row=3, col=1)
-        
-        fig.update_layout(height=1000, title_text="Executive Dashboard")
-        return fig
+        )]
 
-class SalesTeamDashboard:
+class SalesTeamDashboard(PanelDashboard):
     """Dashboard focused on sales team performance"""
     
-    def __init__(self, data):
-        self.data = data
-        self.chart_gen = ChartGenerator(data)
+    PANELS = [
+        ('Top Performers', 'bar', '_panel_top_performers'),
+        ('Sales by Region', 'bar', '_panel_sales_by_region'),
+        ('Monthly Targets', 'scatter', None),
+        ('Activity Levels', 'bar', '_panel_activity_levels'),
+        ('Conversion Rates', 'bar', None),
+        ('Team Leaderboard', 'table', '_panel_team_leaderboard'),
+    ]
+    GRID_COLS = 3
+    HEIGHT = 800
+    TITLE = "Sales Team Performance Dashboard"
+    
+    def _rep_stats(self):
+        """
+        Per-rep total sales, transactions and unique customers from one fused pass
+        
+        Returns:
+            pd.DataFrame: Total_Sales, Transactions and Customers indexed by Sales_Rep
+        """
+        key = ('Sales_Rep', None, 'rep_stats')
+        self._check_agg_cache()
+        
+        if key not in self._agg_cache:
+            rep_codes, reps = pd.factorize(self.data['Sales_Rep'])
+            if 'Customer_ID' in self.data.columns:
+                customer_codes, customers = self._group_codes('Customer_ID')
+            else:
+                # Without customer IDs every transaction counts as its own customer
+                customer_codes, customers = np.arange(len(self.data)), self.data.index
+            
+            sums, counts, unique_customers = group_stats(rep_codes, self.data['Total_Sales'].to_numpy(),
+                                                         customer_codes, len(reps), len(customers))
+            self._agg_cache[key] = pd.DataFrame({
+                'Total_Sales': sums,
+                'Transactions': counts,
+                'Customers': unique_customers
+            }, index=pd.Index(np.asarray(reps), name='Sales_Rep'))
+        
+        return self._agg_cache[key]
     
-    def create_sales_performance_dashboard(self):
+    def create_sales_performance_dashboard(self, include=None):
         """Create sales team performance dashboard"""
-        fig = make_subplots(
-            rows=2, cols=3,
-            subplot_titles=['Top Performers', 'Sales by Region', 'Monthly Targets',
-                          'Activity Levels', 'Conversion Rates', 'Team Leaderboard'],
-            specs=[[{"type": "bar"}, {"type": "bar"}, {"type": "scatter"}],
-                   [{"type": "bar"}, {"type": "bar"}, {"type": "table"}]]
-        )
+        return self.build(include)
+    
+    def _panel_top_performers(self):
+        rep_performance = top_k(self._rep_stats()['Total_Sales'], 10)
+        return [go.Bar(x=rep_performance.to_numpy(), y=rep_performance.index.to_numpy(),
+                       orientation='h', name='Sales Rep Performance')]
+    
+    def _panel_sales_by_region(self):
+        regional_sales = self._agg('Region')
+        return [go.Bar(x=regional_sales.index.to_numpy(), y=regional_sales.to_numpy(),
+                       name='Regional Sales')]
+    
+    def _panel_activity_levels(self):
+        # Transactions per rep against their sales
+        rep_stats = self._rep_stats()
+        return [go.Scatter(x=rep_stats['Transactions'].to_numpy(), y=rep_stats['Total_Sales'].to_numpy(),
+                           mode='markers', name='Activity vs Sales')]
+    
+    def _panel_team_leaderboard(self):
+        rep_stats = self._rep_stats()
+        sales = rep_stats['Total_Sales'].to_numpy()
+        leaders = top_k_positions(sales, 10)
         
-        # Top performers
-        rep_performance = self.data.groupby('Sales_Rep')['Total_Sales'].sum().nlargest(10)
-        fig.add_trace(go.Bar(x=rep_performance.values, y=rep_performance.index,
-                           orientation='h', name='Sales Rep Performance'), row=1, col=1)
-        
-        # Sales by region
-        regional_sales = self.data.groupby('Region')['Total_Sales'].sum()
-        fig.add_trace(go.Bar(x=regional_sales.index, y=regional_sales.values,
-                           name='Regional Sales'), row=1, col=2)
-        
-        # Activity levels (transactions per rep)
-        activity_levels = self.data.groupby('Sales_Rep').size()
-        sales_amounts = self.data.groupby('Sales_Rep')['Total_Sales'].sum()
-        fig.add_trace(go.Scatter(x=activity_levels.values, y=sales_amounts.values,
-                               mode='markers', name='Activity vs Sales'), row=2, col=1)
-        
-        # Team leaderboard
-        leaderboard = self.data.groupby('Sales_Rep').agg({
-            'Total_Sales': 'sum',
-            'Customer_ID': 'nunique' if 'Customer_ID' in self.data.columns else 'count',
-            'Date': 'count'
-        }).round(2).sort_values('Total_Sales', ascending=False).head(10)
-        
-        fig.add_trace(go.Table(
+        return [go.Table(
             header=dict(values=['Sales Rep', 'Total Sales', 'Customers', 'Transactions']),
-            cells=dict(values=[leaderboard.index,
-                             leaderboard['Total_Sales'],
-                             leaderboard['Customer_ID'],
-                             leaderboard['Date']])
-        ), row=2, col=3)
-        
-        fig.update_layout(height=800, title_text="Sales Team Performance Dashboard")
-        return fig
+            cells=dict(values=[rep_stats.index.to_numpy()[leaders],
+                             sales[leaders],
+                             rep_stats['Customers'].to_numpy()[leaders],
+                             rep_stats['Transactions'].to_numpy()[leaders]],
+                       format=[None, '.2f', None, None])
+        )]
 
-class ProductAnalyticsDashboard:
+class ProductAnalyticsDashboard(PanelDashboard):
     """Dashboard focused on product performance and analytics"""
     
-    def __init__(self, data):
-        self.data = data
-        self.chart_gen = ChartGenerator(data)
+    PANELS = [
+        ('Product Sales Distribution', 'treemap', None),
+        ('Product Trends Over Time', 'scatter', '_panel_product_trends'),
+        ('Price vs Quantity Analysis', 'scatter', '_panel_price_vs_quantity'),
+        ('Product Performance Matrix', 'scatter', '_panel_performance_matrix'),
+        ('Market Share Evolution', 'scatter', None),
+        ('Product Profitability', 'bar', '_panel_product_profitability'),
+    ]
+    GRID_COLS = 2
+    HEIGHT = 1200
+    TITLE = "Product Analytics Dashboard"
     
-    def create_product_analytics_dashboard(self):
+    def create_product_analytics_dashboard(self, include=None):
         """Create comprehensive product analytics dashboard"""
-        fig = make_subplots(
-            rows=3, cols=2,
-            subplot_titles=['Product Sales Distribution', 'Product Trends Over Time',
-                          'Price vs Quantity Analysis', 'Product Performance Matrix',
-                          'Market Share Evolution', 'Product Profitability'],
-            specs=[[{"type": "treemap"}, {"type": "scatter"}],
-                   [{"type": "scatter"}, {"type": "scatter"}],
-                   [{"type": "scatter"}, {"type": "bar"}]]
-        )
-        
-        # Product trends over time
-        product_trends = self.data.groupby(['Date', 'Product'])['Total_Sales'].sum().reset_index()
-        for product in product_trends['Product'].unique()[:5]:  # Top 5 products
-            product_data = product_trends[product_trends['Product'] == product]
-            fig.add_trace(go.Scatter(x=product_data['Date'], y=product_data['Total_Sales'],
-                                   mode='lines', name=product), row=1, col=2)
-        
-        # Price vs Quantity analysis
-        if 'Unit_Price' in self.data.columns and 'Quantity' in self.data.columns:
-            fig.add_trace(go.Scatter(
-                x=self.data['Unit_Price'], 
-                y=self.data['Quantity'],
-                mode='markers',
-                text=self.data['Product'],
-                name='Price vs Quantity'
-            ), row=2, col=1)
-        
-        # Product performance matrix (Sales vs Customers)
-        product_metrics = self.data.groupby('Product').agg({
-            'Total_Sales': 'sum',
-            'Customer_ID': 'nunique' if 'Customer_ID' in self.data.columns else 'count'
+        return self.build(include)
+    
+    def _panel_product_trends(self):
+        # One Date x Product pivot, one WebGL trace per top-5 product
+        product_trends = self._agg(('Date', 'Product')).unstack('Product')
+        dates = product_trends.index.to_numpy()
+        return [go.Scattergl(x=dates, y=product_trends[product].to_numpy(),
+                             mode='lines', connectgaps=True, name=str(product))
+                for product in top_k(self._agg('Product'), 5).index]
+    
+    def _panel_price_vs_quantity(self):
+        if 'Unit_Price' not in self.data.columns or 'Quantity' not in self.data.columns:
+            return []
+        return [self._price_quantity_trace()]
+    
+    def _panel_performance_matrix(self):
+        # Sales vs Customers per product
+        product_metrics = pd.DataFrame({
+            'Total_Sales': self._agg('Product'),
+            'Customer_ID': self._agg('Product', 'Customer_ID', 'nunique') if 'Customer_ID' in self.data.columns
+                           else self._agg('Product', how='size')
         })
         
-        fig.add_trace(go.Scatter(
-            x=product_metrics['Total_Sales'],
-            y=product_metrics['Customer_ID'],
+        labels = product_metrics.index.to_numpy(dtype=object)
+        if len(labels) <= MAX_POINT_LABELS:
+            scatter, text = go.Scatter, labels
+        else:
+            # One text node per product would dominate paint time
+            scatter, text = go.Scattergl, np.full(len(labels), '', dtype=object)
+            top = top_k_positions(product_metrics['Total_Sales'].to_numpy(), MAX_POINT_LABELS)
+            text[top] = labels[top]
+        
+        return [scatter(
+            x=product_metrics['Total_Sales'].to_numpy(),
+            y=product_metrics['Customer_ID'].to_numpy(),
             mode='markers+text',
-            text=product_metrics.index,
+            text=text,
+            hovertext=labels,
             textposition='top center',
             name='Performance Matrix'
-        ), row=2, col=2)
+        )]
+    
+    def _panel_product_profitability(self):
+        # If we have cost data, simulate it
+        product_sales = self._agg('Product').sort_values(ascending=True)
+        return [go.Bar(x=product_sales.to_numpy(), y=product_sales.index.to_numpy(),
+                       orientation='h', name='Product Sales')]
+    
+    def _price_quantity_trace(self, width=800, height=600):
+        """
+        Build the price vs quantity scatter as a WebGL trace, or as a
+        datashader raster image for very large datasets
+        """
+        prices = self.data['Unit_Price'].to_numpy()
+        quantities = self.data['Quantity'].to_numpy()
         
-        # Product profitability (if we have cost data, simulate it)
-        product_sales = self.data.groupby('Product')['Total_Sales'].sum().sort_values(ascending=True)
-        fig.add_trace(go.Bar(x=product_sales.values, y=product_sales.index,
-                           orientation='h', name='Product Sales'), row=3, col=2)
+        if len(self.data) > RASTERIZE_THRESHOLD:
+            try:
+                import datashader as ds
+                
+                canvas = ds.Canvas(plot_width=width, plot_height=height)
+                image = ds.tf.shade(canvas.points(self.data, 'Unit_Price', 'Quantity')).to_pil()
+                x_min, x_max = np.nanmin(prices), np.nanmax(prices)
+                y_min, y_max = np.nanmin(quantities), np.nanmax(quantities)
+                
+                # datashader puts the highest values in the first row; flip so row 0 is y_min.
+                # The image is RGBA with empty pixels fully transparent, which the
+                # default 'rgb' colormodel would drop and draw as black
+                return go.Image(z=np.flipud(np.asarray(image)), colormodel='rgba256',
+                                x0=x_min, dx=(x_max - x_min) / width,
+                                y0=y_min, dy=(y_max - y_min) / height,
+                                name='Price vs Quantity')
+            except ImportError:
+                pass  # fall back to WebGL markers
         
-        fig.update_layout(height=1200, title_text="Product Analytics Dashboard")
-        return fig
+        return go.Scattergl(
+            x=prices,
+            y=quantities,
+            mode='markers',
+            hovertemplate='Price: $%{x:,.2f}<br>Quantity: %{y}<extra></extra>',
+            name='Price vs Quantity'
+        )
 
-class FinancialDashboard:
+class FinancialDashboard(PanelDashboard):
     """Financial performance dashboard"""
     
-    def __init__(self, data):
-        self.data = data
-        self.chart_gen = ChartGenerator(data)
+    PANELS = [
+        ('Revenue Waterfall', 'waterfall', '_panel_revenue_waterfall'),
+        ('Profit Margins', 'bar', None),
+        ('Cash Flow Trend', 'scatter', '_panel_cash_flow_trend'),
+        ('Revenue Breakdown', 'pie', '_panel_revenue_breakdown'),
+        ('Financial Ratios', 'indicator', '_panel_total_revenue'),
+        ('Budget vs Actual', 'bar', None),
+    ]
+    GRID_COLS = 3
+    HEIGHT = 800
+    TITLE = "Financial Performance Dashboard"
     
-    def create_financial_dashboard(self):
+    def create_financial_dashboard(self, include=None):
         """Create financial performance dashboard"""
-        fig = make_subplots(
-            rows=2, cols=3,
-            subplot_titles=['Revenue Waterfall', 'Profit Margins', 'Cash Flow Trend',
-                          'Revenue Breakdown', 'Financial Ratios', 'Budget vs Actual'],
-            specs=[[{"type": "waterfall"}, {"type": "bar"}, {"type": "scatter"}],
-                   [{"type": "pie"}, {"type": "indicator"}, {"type": "bar"}]]
-        )
-        
-        # Revenue waterfall
-        monthly_revenue = self.data.groupby(pd.Grouper(key='Date', freq='M'))['Total_Sales'].sum()
-        monthly_changes = monthly_revenue.diff().fillna(monthly_revenue.iloc[0])
+        return self.build(include)
+    
+    def _panel_revenue_waterfall(self):
+        monthly_revenue = self._agg('M')
+        revenue = monthly_revenue.to_numpy()
+        monthly_changes = np.empty_like(revenue)
+        monthly_changes[:1] = revenue[:1]
+        np.subtract(revenue[1:], revenue[:-1], out=monthly_changes[1:])
         
-        fig.add_trace(go.Waterfall(
+        return [go.Waterfall(
             name="Revenue",
             orientation="v",
             measure=["absolute"] + ["relative"] * (len(monthly_changes) - 1),
-            x=[str(x)[:7] for x in monthly_revenue.index],
-            y=monthly_changes.values,
+            x=monthly_revenue.index.strftime('%Y-%m').tolist(),
+            y=monthly_changes,
             connector={"line": {"color": "rgb(63, 63, 63)"}},
             decreasing={"marker": {"color": "red"}},
             increasing={"marker": {"color": "green"}},
-        ), row=1, col=1)
-        
-        # Cash flow trend
-        daily_revenue = self.data.groupby('Date')['Total_Sales'].sum()
-        cumulative_revenue = daily_revenue.cumsum()
-        fig.add_trace(go.Scatter(x=cumulative_revenue.index, y=cumulative_revenue.values,
-                               mode='lines', name='Cumulative Revenue'), row=1, col=3)
-        
-        # Revenue breakdown
-        revenue_by_product = self.data.groupby('Product')['Total_Sales'].sum()
-        fig.add_trace(go.Pie(labels=revenue_by_product.index, values=revenue_by_product.values,
-                           name='Revenue Breakdown'), row=2, col=1)
-        
-        # Financial KPI
-        total_revenue = self.data['Total_Sales'].sum()
-        fig.add_trace(go.Indicator(
+        )]
+    
+    def _panel_cash_flow_trend(self):
+        daily_revenue = self._agg('Date')
+        dates, cumulative_revenue = downsample_lttb(daily_revenue.index.to_numpy(),
+                                                    np.cumsum(daily_revenue.to_numpy()))
+        scatter = go.Scattergl if len(dates) > WEBGL_THRESHOLD else go.Scatter
+        return [scatter(x=dates, y=cumulative_revenue, mode='lines', name='Cumulative Revenue')]
+    
+    def _panel_revenue_breakdown(self):
+        revenue_by_product = self._agg('Product')
+        return [go.Pie(labels=revenue_by_product.index.to_numpy(), values=revenue_by_product.to_numpy(),
+                       name='Revenue Breakdown')]
+    
+    def _panel_total_revenue(self):
+        total_revenue = self._sales_totals()['sum']
+        return [go.Indicator(
             mode="number+gauge",
             value=total_revenue,
             title={"text": "Total Revenue"},
             gauge={'axis': {'range': [0, total_revenue * 1.5]}}
-        ), row=2, col=2)
-        
-        fig.update_layout(height=800, title_text="Financial Performance Dashboard")
-        return fig
+        )]
+
+def create_all_dashboards():
+    """Generate sample data and display every custom dashboard"""
+    from sales_analyzer import SalesVisualizationTool
+    
+    sales_tool = SalesVisualizationTool()
+    sales_tool.generate_sample_data(2000)
+    
+    executive = ExecutiveDashboard(sales_tool.data)
+    executive.create_kpi_cards().show()
+    executive.create_executive_summary().show()
+    
+    SalesTeamDashboard(sales_tool.data).create_sales_performance_dashboard().show()
+    ProductAnalyticsDashboard(sales_tool.data).create_product_analytics_dashboard().show()
+    FinancialDashboard(sales_tool.data).create_financial_dashboard().show()
 
-def create_
\ No newline at end of file
+if __name__ == "__main__":
+    create_all_dashboards()
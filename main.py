@@ -9,16 +9,37 @@ from datetime import datetime
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from sales_analyzer import SalesVisualizationTool
 from config import DATA_DIR, OUTPUT_DIR, CHARTS_DIR, REPORTS_DIR
 
+_dirs_ready = False
+
 def ensure_directories():
-    """Create necessary directories if they don't exist"""
-    directories = [DATA_DIR, OUTPUT_DIR, CHARTS_DIR, REPORTS_DIR]
+    """Create necessary directories if they don't exist (once per process)"""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    
+    # Leaf directories only: makedirs creates OUTPUT_DIR along with its children
+    directories = [DATA_DIR, CHARTS_DIR, REPORTS_DIR]
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+    _dirs_ready = True
     print("✓ Directory structure verified")
 
+# Menu options that need the visualization tool (everything except 0 - Exit)
+TOOL_CHOICES = {str(option) for option in range(1, 12)}
+
+def create_sales_tool():
+    """Import and initialize the tool; deferred because it pulls in pandas, matplotlib and plotly"""
+    import pandas as pd
+    from sales_analyzer import SalesVisualizationTool
+    
+    # Copy-on-Write (the default from pandas 3.0) lets DataProcessor return
+    # shallow copies; it is enabled here rather than by importing a module
+    pd.set_option('mode.copy_on_write', True)
+    return SalesVisualizationTool()
+
 def main():
     """Main function to run the sales visualization tool"""
     print("=" * 50)
@@ -28,8 +49,8 @@ def main():
     # Ensure directories exist
     ensure_directories()
     
-    # Initialize the tool
-    sales_tool = SalesVisualizationTool()
+    # The tool is initialized on the first choice that needs it
+    sales_tool = None
     
     # Menu system
     while True:
@@ -53,7 +74,14 @@ def main():
             print("Thank you for using Sales Visualization Tool!")
             break
         
-        elif choice == "1":
+        if choice not in TOOL_CHOICES:
+            print("Invalid choice. Please try again.")
+            continue
+        
+        if sales_tool is None:
+            sales_tool = create_sales_tool()
+        
+        if choice == "1":
             print("\nGenerating sample data...")
             sales_tool.generate_sample_data(1500)
             sales_tool.data_summary()
@@ -118,9 +146,6 @@ def main():
                 generate_full_report(sales_tool)
             else:
                 print("Please load data first (option 1 or 2)")
-        
-        else:
-            print("Invalid choice. Please try again.")
 
 def run_demo(sales_tool):
     """Run a complete demo of all visualizations"""
@@ -160,13 +185,9 @@ def generate_full_report(sales_tool):
         print(f"Generating comprehensive report...")
         print(f"Report will be saved to: {report_file}")
         
-        # Generate all static plots for the report
-        sales_tool.create_time_series_plot(interactive=False)
-        sales_tool.create_product_analysis(interactive=False)
-        sales_tool.create_regional_analysis(interactive=False)
-        sales_tool.create_sales_rep_performance(interactive=False)
-        sales_tool.create_monthly_trends(interactive=False)
-        sales_tool.create_correlation_heatmap()
+        # Generate all static plots for the report, one worker process per plot;
+        # they are shown once every plot has been saved
+        sales_tool.generate_all(interactive=False)
         
         print(f"✓ Report generated successfully!")
         print(f"Check the {REPORTS_DIR} directory for output files")
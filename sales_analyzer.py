@@ -6,53 +6,344 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
+import importlib.util
 import warnings
 import os
 from config import COLORS, PLOTLY_CONFIG, CHARTS_DIR
+from src.utils import HAS_NUMBA, NUMBA_MIN_ROWS, FrameCache, compiled, group_counts, group_nunique, group_sums, top_k
 warnings.filterwarnings('ignore')
 
+# Line traces longer than this are drawn with WebGL and, when plotly-resampler
+# is installed, downsampled with LTTB to RESAMPLER_POINTS points
+WEBGL_THRESHOLD = 5_000
+RESAMPLER_POINTS = 2_000
+
+def _corr_loop(values):
+    """
+    Pearson correlation matrix of the columns of a 2-D float64 array in one pass
+    
+    Sums and cross-products are accumulated around the first row, which keeps
+    the one-pass formula numerically stable.
+    """
+    n, k = values.shape
+    sums = np.zeros(k)
+    cross = np.zeros((k, k))
+    for i in range(n):
+        for a in range(k):
+            da = values[i, a] - values[0, a]
+            sums[a] += da
+            for b in range(a, k):
+                cross[a, b] += da * (values[i, b] - values[0, b])
+    
+    corr = np.eye(k)
+    for a in range(k):
+        for b in range(a + 1, k):
+            cov = cross[a, b] - sums[a] * sums[b] / n
+            var_a = cross[a, a] - sums[a] * sums[a] / n
+            var_b = cross[b, b] - sums[b] * sums[b] / n
+            corr[a, b] = corr[b, a] = cov / np.sqrt(var_a * var_b)
+    return corr
+
+def _pearson(frame):
+    """
+    Return the Pearson correlation matrix of the numeric columns of frame
+    
+    Large NaN-free inputs use the compiled _corr_loop when numba is installed,
+    other NaN-free inputs np.corrcoef; pandas handles missing values pairwise.
+    """
+    values = frame.to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        return frame.corr()
+    if HAS_NUMBA and len(values) >= NUMBA_MIN_ROWS:
+        corr = compiled(_corr_loop)(values)
+    else:
+        corr = np.corrcoef(values, rowvar=False)
+    return pd.DataFrame(corr, index=frame.columns, columns=frame.columns)
+
+# Background threads that write Plotly chart files (see save_chart), created on first use
+_io_pool = None
+
+def _get_io_pool():
+    """Return the shared chart-writing thread pool"""
+    global _io_pool
+    if _io_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='chart-io')
+    return _io_pool
+
+def _write_plotly_files(fig, filepath, export_png):
+    """Write a Plotly figure to HTML (and optionally PNG), reporting the outcome"""
+    try:
+        fig.write_html(f"{filepath}.html")
+        if export_png:
+            fig.write_image(f"{filepath}.png")
+        print(f"Chart saved: {filepath}")
+    except Exception as e:
+        print(f"Error saving chart: {e}")
+
+# Tool instance of a generate_all() worker process, set up once by _init_chart_worker
+_worker_tool = None
+
+def _init_chart_worker(data):
+    """Receive the data once per worker process and render with the Agg backend"""
+    global _worker_tool
+    import matplotlib
+    matplotlib.use('Agg')
+    _worker_tool = SalesVisualizationTool()
+    _worker_tool.data = data
+
+def _run_chart_task(method_name, kwargs):
+    """Run one chart method on the worker's tool and return the static images it saved"""
+    _worker_tool._saved_images = []
+    getattr(_worker_tool, method_name)(**kwargs)
+    _worker_tool.flush()
+    return _worker_tool._saved_images
+
 class SalesVisualizationTool:
-    def __init__(self):
-        """Initialize the Sales Visualization Tool"""
+    # Low-cardinality string columns stored as categoricals so groupby works on integer codes
+    CATEGORICAL_COLUMNS = ('Product', 'Region', 'Sales_Rep', 'Customer_ID')
+    
+    # Independent chart methods run by generate_all(); True if they take `interactive`
+    CHART_METHODS = (
+        ('create_time_series_plot', True),
+        ('create_product_analysis', True),
+        ('create_regional_analysis', True),
+        ('create_sales_rep_performance', True),
+        ('create_monthly_trends', True),
+        ('create_correlation_heatmap', False),
+    )
+    
+    # Aggregations the Dask path can compute; anything else runs in pandas
+    DASK_AGGREGATIONS = ('sum', 'mean', 'count', 'size', 'min', 'max', 'nunique')
+    
+    def __init__(self, use_dask=False):
+        """
+        Initialize the Sales Visualization Tool
+        
+        Args:
+            use_dask (bool): Generate sample data and compute aggregations with
+                Dask across all cores (requires dask[dataframe])
+        """
+        if use_dask and importlib.util.find_spec('dask') is None:
+            print("⚠ dask is not installed, using pandas")
+            use_dask = False
+        self.use_dask = use_dask
         self.data = None
         self.processed_data = None
+        self._pending_io = []
+        # PNG paths written by save_chart for Matplotlib charts, reported back by generate_all workers
+        self._saved_images = []
+        self._reset_agg_cache()
         
         # Set plotting styles
         plt.style.use('default')
         sns.set_palette(COLORS['palette'])
         
-    def generate_sample_data(self, num_records=1000):
-        """Generate sample sales data for demonstration"""
-        np.random.seed(42)
+    def _reset_agg_cache(self):
+        """Drop cached aggregations (called whenever self.data is replaced)"""
+        self._agg_cache = FrameCache(self.data)
+    
+    def _categorize_columns(self):
+        """Convert CATEGORICAL_COLUMNS of self.data to category dtype and reset the cache"""
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in self.data.columns and not isinstance(self.data[col].dtype, pd.CategoricalDtype):
+                self.data[col] = self.data[col].astype('category')
+        self._reset_agg_cache()
+    
+    def _agg(self, by, col='Total_Sales', how='sum'):
+        """
+        Return self.data grouped by `by` with `col` aggregated using `how`, memoized
         
-        # Date range
+        Args:
+            by (str or list): Column(s) to group by; 'M' stands for the
+                calendar month of Date as an integer code (see _month_codes)
+            col (str): Value column to aggregate, or None to apply `how` to the frame
+            how (str or dict): Aggregation name, or a column -> aggregation mapping
+            
+        Returns:
+            pd.Series or pd.DataFrame: Aggregated values indexed by group.
+                The result is shared between calls, so copy before modifying it.
+        """
+        if not self._agg_cache.is_for(self.data):
+            self._reset_agg_cache()
+        
+        key = (tuple(by) if isinstance(by, list) else by, col,
+               how if isinstance(how, str) else repr(how))
+        if key not in self._agg_cache and how == 'sum' and isinstance(by, str) and by in self.data.columns \
+                and isinstance(self.data[by].dtype, pd.CategoricalDtype):
+            # Summing over a categorical key: reduce the integer codes directly
+            self._agg_cache[key] = self._sum_by_codes(by, col)
+        if key not in self._agg_cache and self.use_dask and 'M' not in (by if isinstance(by, list) else [by]):
+            funcs = [how] if isinstance(how, str) else [func for funcs in how.values()
+                                                       for func in (funcs if isinstance(funcs, list) else [funcs])]
+            if all(func in self.DASK_AGGREGATIONS for func in funcs):
+                self._agg_cache[key] = self._dask_agg(by, col, how)
+        if key not in self._agg_cache:
+            if isinstance(by, list):
+                grouper = [self._month_codes() if name == 'M' else name for name in by]
+            else:
+                grouper = self._month_codes() if by == 'M' else by
+            grouped = self.data.groupby(grouper, observed=True)
+            if col is None and isinstance(by, str) and self._is_categorical(by):
+                self._agg_cache[key] = self._agg_with_codes(by, grouped, how)
+            else:
+                self._agg_cache[key] = grouped.agg(how) if col is None else grouped[col].agg(how)
+        return self._agg_cache[key]
+    
+    def _summary_stats(self):
+        """
+        Return the Date range and Total_Sales sum/mean of self.data, memoized
+        alongside the _agg() results
+        
+        Returns:
+            dict: first_date, last_date, total_sales and avg_sale
+        """
+        if not self._agg_cache.is_for(self.data):
+            self._reset_agg_cache()
+        
+        key = (None, None, 'summary')
+        if key not in self._agg_cache:
+            # One agg call per column; Total_Sales is accumulated in float64
+            # because the stored column may be float32
+            dates = self.data['Date'].agg(['min', 'max'])
+            sales = self.data['Total_Sales'].astype(np.float64).agg(['sum', 'mean'])
+            self._agg_cache[key] = {'first_date': dates['min'], 'last_date': dates['max'],
+                                    'total_sales': sales['sum'], 'avg_sale': sales['mean']}
+        return self._agg_cache[key]
+    
+    def _is_categorical(self, col):
+        """Return True if `col` is a column of self.data with category dtype"""
+        return col in self.data.columns and isinstance(self.data[col].dtype, pd.CategoricalDtype)
+    
+    def _agg_with_codes(self, by, grouped, how):
+        """
+        Apply a column -> aggregation mapping, counting distinct categorical
+        values from integer codes (see _nunique_by_codes) instead of hashing them
+        """
+        distinct = [c for c, func in how.items() if func == 'nunique' and self._is_categorical(c)]
+        rest = {c: func for c, func in how.items() if c not in distinct}
+        if not distinct or not rest:
+            return grouped.agg(how)
+        
+        result = grouped.agg(rest)
+        multi = isinstance(result.columns, pd.MultiIndex)
+        for c in distinct:
+            result[(c, 'nunique') if multi else c] = self._nunique_by_codes(by, c)
+        
+        order = [(c, func) for c, funcs in how.items()
+                 for func in (funcs if isinstance(funcs, list) else [funcs])] if multi else list(how)
+        return result[order]
+    
+    def _dask_agg(self, by, col, how):
+        """
+        Compute an _agg() aggregation with Dask over partitions of self.data
+        
+        Each output column is reduced separately (dask's dict aggregation has
+        no nunique) and all of them are computed together in one graph.
+        The result is laid out like the pandas groupby result.
+        """
+        import dask
+        
+        key = (None, None, 'dask_frame')
+        if key not in self._agg_cache:
+            import dask.dataframe as dd
+            self._agg_cache[key] = dd.from_pandas(self.data, npartitions=os.cpu_count() or 1)
+        grouped = self._agg_cache[key].groupby(by, observed=True)
+        
+        def reduce(column, func):
+            return grouped[column].nunique() if func == 'nunique' else grouped[column].agg(func)
+        
+        if col is not None:
+            return reduce(col, how).compute().sort_index()
+        
+        multi = any(isinstance(funcs, list) for funcs in how.values())
+        names, parts = [], []
+        for column, funcs in how.items():
+            for func in (funcs if isinstance(funcs, list) else [funcs]):
+                names.append((column, func) if multi else column)
+                parts.append(reduce(column, func))
+        return pd.concat(dask.compute(*parts), axis=1, keys=names).sort_index()
+    
+    def _month_codes(self):
+        """Calendar month of each Date as year * 12 + month - 1, named 'Month' (memoized)"""
+        if not self._agg_cache.is_for(self.data):
+            self._reset_agg_cache()
+        
+        key = ('Date', None, 'month_codes')
+        if key not in self._agg_cache:
+            dates = self.data['Date']
+            self._agg_cache[key] = (dates.dt.year * 12 + dates.dt.month - 1).rename('Month')
+        return self._agg_cache[key]
+    
+    @staticmethod
+    def _month_labels(codes):
+        """Format month codes from _month_codes as 'YYYY-MM' labels"""
+        return [f"{code // 12}-{code % 12 + 1:02d}" for code in codes]
+    
+    def _sum_by_codes(self, by, col):
+        """Sum `col` per category of `by` with np.bincount, dropping unobserved categories"""
+        codes = self.data[by].cat.codes.to_numpy()
+        categories = self.data[by].cat.categories
+        sums = group_sums(codes, self.data[col].to_numpy(dtype=np.float64), len(categories))
+        observed = group_counts(codes, len(categories)) > 0
+        return pd.Series(sums[observed], index=pd.Index(categories[observed], name=by), name=col)
+    
+    def _nunique_by_codes(self, by, col):
+        """
+        Count distinct values of categorical `col` per category of `by`
+        with group_nunique, dropping unobserved categories
+        """
+        categories = self.data[by].cat.categories
+        group_codes = self.data[by].cat.codes.to_numpy()
+        member_codes = self.data[col].cat.codes.to_numpy()
+        counts = group_nunique(group_codes, member_codes, len(categories), len(self.data[col].cat.categories))
+        observed = group_counts(group_codes, len(categories)) > 0
+        return pd.Series(counts[observed], index=pd.Index(categories[observed], name=by), name=col)
+    
+    @staticmethod
+    def _sample_frame(rng, num_records):
+        """Draw num_records random sales records from rng, one vectorized draw per column"""
+        # Dates are drawn as int64 day offsets, no intermediate date_range
         start_date = datetime(2023, 1, 1)
         end_date = datetime(2024, 12, 31)
-        date_range = pd.date_range(start_date, end_date, freq='D')
-        
-        # Sample data generation
-        data = []
-        products = ['Laptop', 'Phone', 'Tablet', 'Headphones', 'Mouse', 'Keyboard', 'Monitor']
-        regions = ['North', 'South', 'East', 'West', 'Central']
-        sales_reps = [f'Rep_{i}' for i in range(1, 21)]
-        
-        for _ in range(num_records):
-            record = {
-                'Date': np.random.choice(date_range),
-                'Product': np.random.choice(products),
-                'Region': np.random.choice(regions),
-                'Sales_Rep': np.random.choice(sales_reps),
-                'Quantity': np.random.randint(1, 50),
-                'Unit_Price': np.random.uniform(50, 2000),
-                'Customer_ID': f'CUST_{np.random.randint(1000, 9999)}'
-            }
-            record['Total_Sales'] = record['Quantity'] * record['Unit_Price']
-            data.append(record)
-        
-        self.data = pd.DataFrame(data)
-        self.data['Date'] = pd.to_datetime(self.data['Date'])
-        self.data['Month'] = self.data['Date'].dt.to_period('M')
-        self.data['Quarter'] = self.data['Date'].dt.to_period('Q')
+        n_days = (end_date - start_date).days + 1
+        
+        products = np.array(['Laptop', 'Phone', 'Tablet', 'Headphones', 'Mouse', 'Keyboard', 'Monitor'])
+        regions = np.array(['North', 'South', 'East', 'West', 'Central'])
+        sales_reps = np.array([f'Rep_{i}' for i in range(1, 21)])
+        
+        # Narrow dtypes halve the bandwidth of the groupby reductions; float32 holds
+        # cent precision for these amounts and the sums still accumulate in float64
+        quantity = rng.integers(1, 50, num_records).astype(np.int16)
+        unit_price = rng.uniform(50, 2000, num_records).astype(np.float32)
+        
+        return pd.DataFrame({
+            'Date': pd.to_datetime((np.datetime64(start_date.date(), 'D')
+                                    + rng.integers(0, n_days, num_records).astype('timedelta64[D]'))
+                                   .astype('datetime64[ns]')),
+            'Product': products[rng.integers(0, len(products), num_records)],
+            'Region': regions[rng.integers(0, len(regions), num_records)],
+            'Sales_Rep': sales_reps[rng.integers(0, len(sales_reps), num_records)],
+            'Quantity': quantity,
+            'Unit_Price': unit_price,
+            'Customer_ID': np.char.add('CUST_', rng.integers(1000, 9999, num_records).astype(str)),
+            'Total_Sales': quantity * unit_price
+        })
+    
+    def generate_sample_data(self, num_records=1000):
+        """Generate sample sales data for demonstration"""
+        if self.use_dask:
+            # Partitions are drawn in parallel from independent child seeds
+            import dask
+            n_parts = max(1, min(os.cpu_count() or 1, num_records // 100_000))
+            sizes = [len(part) for part in np.array_split(np.arange(num_records), n_parts)]
+            seeds = np.random.SeedSequence(42).spawn(n_parts)
+            parts = [dask.delayed(self._sample_frame)(np.random.default_rng(seed), size)
+                     for seed, size in zip(seeds, sizes)]
+            self.data = pd.concat(dask.compute(*parts), ignore_index=True)
+        else:
+            self.data = self._sample_frame(np.random.default_rng(42), num_records)
+        self._categorize_columns()
         
         print(f"Generated {len(self.data)} sales records")
         
@@ -65,8 +356,13 @@ class SalesVisualizationTool:
     def load_data(self, file_path):
         """Load sales data from CSV file"""
         try:
-            self.data = pd.read_csv(file_path)
+            # pyarrow's multithreaded reader parses the file and the dates in one pass
+            try:
+                self.data = pd.read_csv(file_path, engine='pyarrow', parse_dates=['Date'])
+            except ImportError:
+                self.data = pd.read_csv(file_path, parse_dates=['Date'])
             self.data['Date'] = pd.to_datetime(self.data['Date'])
+            self._categorize_columns()
             print(f"Loaded {len(self.data)} records from {file_path}")
             return self.data
         except Exception as e:
@@ -81,42 +377,94 @@ class SalesVisualizationTool:
         
         print("=== DATA SUMMARY ===")
         print(f"Shape: {self.data.shape}")
-        print(f"Date Range: {self.data['Date'].min()} to {self.data['Date'].max()}")
-        print(f"Total Sales: ${self.data['Total_Sales'].sum():,.2f}")
-        print(f"Average Sale: ${self.data['Total_Sales'].mean():.2f}")
+        stats = self._summary_stats()
+        print(f"Date Range: {stats['first_date']} to {stats['last_date']}")
+        print(f"Total Sales: ${stats['total_sales']:,.2f}")
+        print(f"Average Sale: ${stats['avg_sale']:.2f}")
         print("\n=== TOP PRODUCTS ===")
-        print(self.data.groupby('Product')['Total_Sales'].sum().sort_values(ascending=False).head())
+        print(top_k(self._agg('Product'), 5))
         print("\n=== SALES BY REGION ===")
-        print(self.data.groupby('Region')['Total_Sales'].sum().sort_values(ascending=False))
+        print(self._agg('Region').sort_values(ascending=False))
     
-    def save_chart(self, fig, filename, chart_type='plotly'):
-        """Save chart to file"""
+    def save_chart(self, fig, filename, chart_type='plotly', export_png=False):
+        """
+        Save chart to file
+        
+        Plotly charts are written as HTML; a PNG is only rendered when
+        export_png is True, since kaleido export takes seconds per chart.
+        Plotly files are written on a background thread so the next chart can
+        start right away; call flush() to wait for them. Matplotlib charts are
+        saved immediately because pyplot must stay on one thread.
+        """
         os.makedirs(CHARTS_DIR, exist_ok=True)
         filepath = os.path.join(CHARTS_DIR, filename)
         
+        if chart_type == 'plotly':
+            self._pending_io = [future for future in self._pending_io if not future.done()]
+            self._pending_io.append(_get_io_pool().submit(_write_plotly_files, fig, filepath, export_png))
+            return
+        
         try:
-            if chart_type == 'plotly':
-                fig.write_html(f"{filepath}.html")
-                fig.write_image(f"{filepath}.png")
-            else:
-                fig.savefig(f"{filepath}.png", dpi=300, bbox_inches='tight')
+            fig.savefig(f"{filepath}.png", dpi=300, bbox_inches='tight')
+            self._saved_images.append(f"{filepath}.png")
             print(f"Chart saved: {filepath}")
         except Exception as e:
             print(f"Error saving chart: {e}")
     
+    def flush(self):
+        """Wait until every chart file queued by save_chart has been written"""
+        for future in self._pending_io:
+            future.result()
+        self._pending_io = []
+    
+    def _add_line_trace(self, fig, x, y, name, color, row=None, col=None):
+        """
+        Add a line trace to fig, switching to WebGL for long series
+        
+        Series longer than WEBGL_THRESHOLD become Scattergl traces; if
+        plotly-resampler is installed the figure is wrapped in a
+        FigureResampler so only an LTTB downsample is serialized.
+        
+        Returns:
+            go.Figure: The figure holding the trace (a FigureResampler when used)
+        """
+        if len(x) <= WEBGL_THRESHOLD:
+            fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name=name,
+                                     line=dict(color=color)), row=row, col=col)
+            return fig
+        
+        try:
+            from plotly_resampler import FigureResampler
+            from plotly_resampler.aggregation import LTTB
+        except ImportError:
+            fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=name,
+                                       line=dict(color=color)), row=row, col=col)
+            return fig
+        
+        fig = FigureResampler(fig, default_n_shown_samples=RESAMPLER_POINTS, default_downsampler=LTTB())
+        fig.add_trace(go.Scattergl(mode='lines', name=name, line=dict(color=color)),
+                      hf_x=x, hf_y=y, row=row, col=col)
+        return fig
+    
     def create_time_series_plot(self, interactive=True):
         """Create time series plot of sales over time"""
         if self.data is None:
             print("No data available")
             return
         
-        daily_sales = self.data.groupby('Date')['Total_Sales'].sum().reset_index()
+        daily_sales = self._agg('Date').reset_index()
         
         if interactive:
-            fig = px.line(daily_sales, x='Date', y='Total_Sales',
-                         title='Daily Sales Trend',
-                         labels={'Total_Sales': 'Sales ($)', 'Date': 'Date'},
-                         color_discrete_sequence=[COLORS['primary']])
+            if len(daily_sales) > WEBGL_THRESHOLD:
+                fig = self._add_line_trace(go.Figure(), daily_sales['Date'].to_numpy(),
+                                           daily_sales['Total_Sales'].to_numpy(),
+                                           'Total_Sales', COLORS['primary'])
+                fig.update_layout(title='Daily Sales Trend', xaxis_title='Date', yaxis_title='Sales ($)')
+            else:
+                fig = px.line(daily_sales, x='Date', y='Total_Sales',
+                             title='Daily Sales Trend',
+                             labels={'Total_Sales': 'Sales ($)', 'Date': 'Date'},
+                             color_discrete_sequence=[COLORS['primary']])
             fig.update_layout(hovermode='x unified')
             fig.show(config=PLOTLY_CONFIG)
             self.save_chart(fig, 'time_series_plot')
@@ -139,11 +487,13 @@ class SalesVisualizationTool:
             print("No data available")
             return
         
-        product_sales = self.data.groupby('Product').agg({
-            'Total_Sales': 'sum',
+        # One pass for all four panels; the mean comes from the same groupby
+        product_sales = self._agg('Product', None, {
+            'Total_Sales': ['sum', 'mean'],
             'Quantity': 'sum',
             'Customer_ID': 'nunique'
         }).reset_index()
+        product_sales.columns = ['Product', 'Total_Sales', 'Avg_Sale', 'Quantity', 'Customer_ID']
         
         if interactive:
             fig = make_subplots(
@@ -167,8 +517,7 @@ class SalesVisualizationTool:
                                name='Customers', marker_color=COLORS['success']), row=2, col=1)
             
             # Average sale per product
-            avg_sales = self.data.groupby('Product')['Total_Sales'].mean()
-            fig.add_trace(go.Bar(x=avg_sales.index, y=avg_sales.values,
+            fig.add_trace(go.Bar(x=product_sales['Product'], y=product_sales['Avg_Sale'],
                                name='Avg Sale', marker_color=COLORS['warning']), row=2, col=2)
             
             fig.update_layout(height=800, title_text="Product Analysis Dashboard", showlegend=False)
@@ -196,8 +545,7 @@ class SalesVisualizationTool:
             ax3.tick_params(axis='x', rotation=45)
             
             # Average sale per product
-            avg_sales = self.data.groupby('Product')['Total_Sales'].mean()
-            avg_sales.plot(kind='bar', ax=ax4, color=COLORS['warning'])
+            product_sales.set_index('Product')['Avg_Sale'].plot(kind='bar', ax=ax4, color=COLORS['warning'])
             ax4.set_title('Average Sale per Product', fontweight='bold')
             ax4.set_ylabel('Average Sale ($)')
             ax4.tick_params(axis='x', rotation=45)
@@ -212,7 +560,7 @@ class SalesVisualizationTool:
             print("No data available")
             return
         
-        regional_data = self.data.groupby('Region').agg({
+        regional_data = self._agg('Region', None, {
             'Total_Sales': 'sum',
             'Quantity': 'sum',
             'Customer_ID': 'nunique'
@@ -241,7 +589,7 @@ class SalesVisualizationTool:
             print("No data available")
             return
         
-        rep_performance = self.data.groupby('Sales_Rep').agg({
+        rep_performance = self._agg('Sales_Rep', None, {
             'Total_Sales': 'sum',
             'Customer_ID': 'nunique',
             'Date': 'count'
@@ -276,8 +624,8 @@ class SalesVisualizationTool:
             print("No data available")
             return
         
-        monthly_data = self.data.groupby(['Month', 'Product'])['Total_Sales'].sum().reset_index()
-        monthly_data['Month_str'] = monthly_data['Month'].astype(str)
+        monthly_data = self._agg(['M', 'Product']).reset_index()
+        monthly_data['Month_str'] = self._month_labels(monthly_data['Month'])
         
         if interactive:
             fig = px.line(monthly_data, x='Month_str', y='Total_Sales', color='Product',
@@ -289,15 +637,16 @@ class SalesVisualizationTool:
             self.save_chart(fig, 'monthly_trends')
         else:
             plt.figure(figsize=(14, 8))
-            for i, product in enumerate(monthly_data['Product'].unique()):
-                product_data = monthly_data[monthly_data['Product'] == product]
-                plt.plot(product_data['Month_str'], product_data['Total_Sales'], 
-                        marker='o', label=product, color=COLORS['palette'][i % len(COLORS['palette'])])
+            # One column per product, drawn with a single plot call
+            wide = monthly_data.pivot(index='Month_str', columns='Product', values='Total_Sales')
+            ax = plt.gca()
+            ax.set_prop_cycle(color=[COLORS['palette'][i % len(COLORS['palette'])] for i in range(wide.shape[1])])
+            lines = ax.plot(wide.index, wide.to_numpy(), marker='o')
             
             plt.title('Monthly Sales Trends by Product', fontsize=16, fontweight='bold')
             plt.xlabel('Month')
             plt.ylabel('Sales ($)')
-            plt.legend()
+            plt.legend(lines, wide.columns)
             plt.xticks(rotation=45)
             plt.grid(True, alpha=0.3)
             plt.tight_layout()
@@ -313,7 +662,7 @@ class SalesVisualizationTool:
         # Select numerical columns
         numerical_cols = ['Quantity', 'Unit_Price', 'Total_Sales']
         if all(col in self.data.columns for col in numerical_cols):
-            corr_matrix = self.data[numerical_cols].corr()
+            corr_matrix = _pearson(self.data[numerical_cols])
             
             plt.figure(figsize=(8, 6))
             sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
@@ -325,6 +674,60 @@ class SalesVisualizationTool:
         else:
             print("Required numerical columns not found")
     
+    def generate_all(self, interactive=True, max_workers=None, show=True):
+        """
+        Create every chart in CHART_METHODS concurrently
+        
+        pyplot keeps global state and is not thread-safe, so each chart runs in
+        a worker process. The data is sent once per worker through the pool
+        initializer rather than with every task. Falls back to running the
+        charts one after another if a process pool cannot be started.
+        
+        Workers render with the Agg backend and cannot open windows, so static
+        charts are shown afterwards from the PNG files they saved.
+        
+        Args:
+            interactive (bool): Create Plotly charts instead of static ones
+            max_workers (int): Number of worker processes (default: one per chart, up to the CPU count)
+            show (bool): Display the saved static charts once all are rendered
+        """
+        if self.data is None:
+            print("No data available")
+            return
+        
+        tasks = [(method_name, {'interactive': interactive} if takes_interactive else {})
+                 for method_name, takes_interactive in self.CHART_METHODS]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        if max_workers is None:
+            max_workers = min(len(tasks), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_chart_worker,
+                                     initargs=(self.data,)) as executor:
+                futures = [executor.submit(_run_chart_task, method_name, kwargs)
+                           for method_name, kwargs in tasks]
+                images = [path for future in futures for path in future.result()]
+        except (OSError, RuntimeError) as e:
+            print(f"⚠ Parallel rendering unavailable ({e}), creating charts sequentially")
+            for method_name, kwargs in tasks:
+                getattr(self, method_name)(**kwargs)
+            self.flush()
+            return
+        
+        if show:
+            self._show_images(images)
+    
+    @staticmethod
+    def _show_images(paths):
+        """Display saved PNG charts with pyplot, one window each at the figure size they were drawn at"""
+        for path in paths:
+            image = plt.imread(path)
+            # save_chart writes Matplotlib charts at 300 dpi
+            plt.figure(figsize=(image.shape[1] / 300, image.shape[0] / 300))
+            plt.imshow(image)
+            plt.axis('off')
+            plt.show()
+    
     def create_comprehensive_dashboard(self):
         """Create a comprehensive interactive dashboard"""
         if self.data is None:
@@ -332,10 +735,9 @@ class SalesVisualizationTool:
             return
         
         # Prepare data
-        daily_sales = self.data.groupby('Date')['Total_Sales'].sum()
-        monthly_sales = self.data.groupby(self.data['Date'].dt.to_period('M'))['Total_Sales'].sum()
-        product_sales = self.data.groupby('Product')['Total_Sales'].sum().sort_values(ascending=False)
-        regional_sales = self.data.groupby('Region')['Total_Sales'].sum()
+        daily_sales = self._agg('Date')
+        monthly_sales = self._agg('M')
+        regional_sales = self._agg('Region')
         
         # Create subplots
         fig = make_subplots(
@@ -349,12 +751,11 @@ class SalesVisualizationTool:
         )
         
         # Daily sales trend
-        fig.add_trace(go.Scatter(x=daily_sales.index, y=daily_sales.values,
-                               mode='lines', name='Daily Sales', 
-                               line=dict(color=COLORS['primary'])), row=1, col=1)
+        fig = self._add_line_trace(fig, daily_sales.index, daily_sales.values,
+                                   'Daily Sales', COLORS['primary'], row=1, col=1)
         
         # Monthly sales
-        fig.add_trace(go.Bar(x=[str(x) for x in monthly_sales.index], y=monthly_sales.values,
+        fig.add_trace(go.Bar(x=self._month_labels(monthly_sales.index), y=monthly_sales.values,
                            name='Monthly Sales', marker_color=COLORS['secondary']), row=2, col=1)
         
         # Regional pie chart
@@ -362,15 +763,16 @@ class SalesVisualizationTool:
                            name='Regional Sales'), row=2, col=2)
         
         # Top products
-        top_products = product_sales.head(10)
+        top_products = top_k(self._agg('Product'), 10)
         fig.add_trace(go.Bar(x=top_products.values, y=top_products.index,
                            orientation='h', name='Top Products',
                            marker_color=COLORS['success']), row=3, col=1)
         
-        # Sales distribution histogram
-        fig.add_trace(go.Histogram(x=self.data['Total_Sales'], nbinsx=30,
-                                 name='Sales Distribution',
-                                 marker_color=COLORS['warning']), row=3, col=2)
+        # Sales distribution histogram, binned here so only 30 counts reach the browser
+        counts, edges = np.histogram(self.data['Total_Sales'].dropna().to_numpy(), bins=30)
+        fig.add_trace(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                             name='Sales Distribution',
+                             marker_color=COLORS['warning']), row=3, col=2)
         
         fig.update_layout(height=1200, title_text="Sales Analytics Dashboard",
                          showlegend=False)
@@ -388,17 +790,20 @@ class SalesVisualizationTool:
             filename = f"sales_report_{timestamp}.html"
         
         # Generate summary statistics
-        total_sales = self.data['Total_Sales'].sum()
-        avg_sale = self.data['Total_Sales'].mean()
+        stats = self._summary_stats()
+        total_sales = stats['total_sales']
+        avg_sale = stats['avg_sale']
         total_transactions = len(self.data)
-        date_range = f"{self.data['Date'].min().strftime('%Y-%m-%d')} to {self.data['Date'].max().strftime('%Y-%m-%d')}"
+        date_range = f"{stats['first_date'].strftime('%Y-%m-%d')} to {stats['last_date'].strftime('%Y-%m-%d')}"
         
-        top_products = self.data.groupby('Product')['Total_Sales'].sum().sort_values(ascending=False).head()
-        top_regions = self.data.groupby('Region')['Total_Sales'].sum().sort_values(ascending=False).head()
-        top_reps = self.data.groupby('Sales_Rep')['Total_Sales'].sum().sort_values(ascending=False).head()
+        top_products = top_k(self._agg('Product'), 5)
+        top_regions = top_k(self._agg('Region'), 5)
+        top_reps = top_k(self._agg('Sales_Rep'), 5)
         
-        # Create HTML report
-        html_content = f"""
+        # Create HTML report, streaming the table rows into one buffer
+        import io
+        buf = io.StringIO()
+        buf.write(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -425,27 +830,29 @@ class SalesVisualizationTool:
                 <div class="metric"><strong>Total Transactions:</strong> {total_transactions:,}</div>
                 <div class="metric"><strong>Date Range:</strong> {date_range}</div>
             </div>
-            
-            <h2>Top Products by Sales</h2>
-            <table>
-                <tr><th>Product</th><th>Total Sales</th></tr>
-                {''.join([f"<tr><td>{prod}</td><td>${sales:,.2f}</td></tr>" for prod, sales in top_products.items()])}
-            </table>
-            
-            <h2>Top Regions by Sales</h2>
+""")
+        
+        sections = [
+            ('Top Products by Sales', 'Product', top_products),
+            ('Top Regions by Sales', 'Region', top_regions),
+            ('Top Sales Representatives', 'Sales Rep', top_reps),
+        ]
+        for title, label, top_sales in sections:
+            buf.write(f"""            
+            <h2>{title}</h2>
             <table>
-                <tr><th>Region</th><th>Total Sales</th></tr>
-                {''.join([f"<tr><td>{region}</td><td>${sales:,.2f}</td></tr>" for region, sales in top_regions.items()])}
+                <tr><th>{label}</th><th>Total Sales</th></tr>
+                """)
+            for name, sales in top_sales.items():
+                buf.write(f"<tr><td>{name}</td><td>${sales:,.2f}</td></tr>")
+            buf.write("""
             </table>
-            
-            <h2>Top Sales Representatives</h2>
-            <table>
-                <tr><th>Sales Rep</th><th>Total Sales</th></tr>
-                {''.join([f"<tr><td>{rep}</td><td>${sales:,.2f}</td></tr>" for rep, sales in top_reps.items()])}
-            </table>
-        </body>
+""")
+        
+        buf.write("""        </body>
         </html>
-        """
+        """)
+        html_content = buf.getvalue()
         
         # Save report
         report_path = os.path.join('output', 'reports', filename)
@@ -4,8 +4,89 @@ Data loading and preprocessing utilities
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import csv
+import hashlib
+import importlib.util
+import json
 import os
-from config import DATA_REQUIRED_COLUMNS, DATE_FORMAT
+import warnings
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+from config import CACHE_DIR, DATA_REQUIRED_COLUMNS, DATE_FORMAT
+try:
+    from .utils import HAS_NUMBA, NUMBA_MIN_ROWS, compiled
+except ImportError:  # imported as a top-level module with src on sys.path
+    from utils import HAS_NUMBA, NUMBA_MIN_ROWS, compiled
+
+# Number of non-null values used to guess the format of a date column
+DATE_FORMAT_SAMPLE = 50
+
+# polars is optional; UTF-8 files of at least LAZY_MIN_BYTES are preprocessed
+# with its lazy, streaming engine (see preprocess_lazy)
+HAS_POLARS = importlib.util.find_spec('polars') is not None
+LAZY_MIN_BYTES = 256 * 1024 * 1024
+
+# With pyarrow installed, load_csv keeps the preprocessed data in a Parquet
+# file in CACHE_DIR (<csv name>-<path hash>.parquet) and reuses it while it is
+# up to date, so nothing is written next to the user's CSV.
+# The file's metadata records the CSV it came from, the encoding it was read
+# with and PARQUET_CACHE_VERSION; bump the version whenever preprocessing or
+# the resulting schema changes, so caches written by older code are rebuilt
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+PARQUET_CACHE_SUFFIX = '.parquet'
+PARQUET_CACHE_VERSION = 1
+PARQUET_CACHE_KEY = b'sales_viz_cache'
+
+# pyarrow parses a CSV in blocks on its thread pool; the block size is chosen
+# so each worker gets several blocks, within these bounds
+MIN_CSV_BLOCK_SIZE = 1 << 20
+MAX_CSV_BLOCK_SIZE = 32 << 20
+
+# Low-cardinality text columns stored as category dtype after preprocessing,
+# so later groupbys work on integer codes
+CATEGORICAL_COLUMNS = ('Product', 'Region', 'Sales_Rep', 'DayOfWeek')
+
+# DayOfWeek categories, indexed by Series.dt.dayofweek
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Where the OS supports it (Linux), CSV files are handed to the kernel with
+# POSIX_FADV_WILLNEED before parsing, so an uncached file is read ahead while
+# the parser starts instead of one buffer at a time on demand
+PREFETCH_FILES = hasattr(os, 'posix_fadvise')
+
+# Separators load_csv recognizes, and how much of the file is read to detect them
+CSV_SEPARATORS = ',;\t|'
+SNIFF_BYTES = 64 * 1024
+
+def _sample_prices_loop(product_idx, min_prices, price_spans, quantity, price_draws, discount_draws,
+                        unit_price, discount, total_sales):
+    """Fill unit_price, discount and total_sales from uniform [0, 1) draws, one record at a time"""
+    for i in range(len(product_idx)):
+        product = product_idx[i]
+        unit_price[i] = min_prices[product] + price_spans[product] * price_draws[i]
+        discount[i] = 0.2 * discount_draws[i]
+        total_sales[i] = quantity[i] * unit_price[i] * (1 - discount[i])
+
+def _sample_prices(product_idx, min_prices, max_prices, quantity, price_draws, discount_draws):
+    """
+    Return the unit prices, 0-20% discounts and discounted totals of sample records
+    
+    Large inputs use the compiled _sample_prices_loop when numba is installed,
+    which avoids numpy's temporary arrays; both give the same values as
+    rng.uniform with the same draws.
+    """
+    price_spans = max_prices - min_prices
+    if HAS_NUMBA and len(product_idx) >= NUMBA_MIN_ROWS:
+        unit_price, discount, total_sales = (np.empty(len(product_idx)) for _ in range(3))
+        compiled(_sample_prices_loop)(product_idx, min_prices, price_spans, quantity, price_draws, discount_draws,
+                                      unit_price, discount, total_sales)
+        return unit_price, discount, total_sales
+    
+    unit_price = min_prices[product_idx] + price_spans[product_idx] * price_draws
+    discount = 0.2 * discount_draws
+    return unit_price, discount, quantity * unit_price * (1 - discount)
 
 class DataLoader:
     """Class to handle data loading and preprocessing"""
@@ -13,39 +94,299 @@ class DataLoader:
     def __init__(self):
         self.data = None
         
-    def load_csv(self, file_path, encoding='utf-8'):
+    def load_csv(self, file_path, encoding='utf-8', chunksize=None, use_cache=True):
         """
         Load data from CSV file with error handling
         
         Args:
             file_path (str): Path to CSV file
             encoding (str): File encoding
+            chunksize (int): If given, read and preprocess the file this many
+                rows at a time (see iter_csv) to keep peak memory low
+            use_cache (bool): Read and write the Parquet cache of the
+                preprocessed data in CACHE_DIR (ignored when chunksize is given)
             
         Returns:
             pd.DataFrame: Loaded data
         """
+        if chunksize:
+            try:
+                df = pd.concat(self.iter_csv(file_path, chunksize, encoding), ignore_index=True, copy=False)
+                self._categorize(df)
+                print(f"✓ Successfully loaded {len(df)} records from {file_path}")
+                print(f"Final shape: {df.shape}")
+                self.data = df
+                return df
+            except Exception as e:
+                print(f"Error loading CSV file: {e}")
+                return None
+        
+        cache_path = self._parquet_cache_path(file_path)
+        if use_cache and HAS_PYARROW:
+            df = self._read_parquet_cache(file_path, cache_path, encoding)
+            if df is not None:
+                return df
+        
+        df = self._parse_csv(file_path, encoding)
+        if use_cache and HAS_PYARROW and df is not None and df is self.data:
+            self._write_parquet_cache(df, file_path, cache_path, encoding)
+        return df
+    
+    @staticmethod
+    def _parquet_cache_path(file_path):
+        """Return the Parquet cache file of file_path in CACHE_DIR, named after the CSV and a hash of its absolute path"""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(CACHE_DIR, f"{stem}-{digest}{PARQUET_CACHE_SUFFIX}")
+    
+    @staticmethod
+    def _parquet_cache_tag(file_path, encoding):
+        """
+        Describe what a Parquet cache of file_path must have been built from
+        
+        Returns:
+            bytes: JSON with the cache version, the encoding and the size and
+                modification time of the CSV
+        """
+        stat = os.stat(file_path)
+        return json.dumps({'version': PARQUET_CACHE_VERSION, 'encoding': encoding.lower(),
+                           'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}).encode()
+    
+    def _read_parquet_cache(self, file_path, cache_path, encoding):
+        """Return the cached preprocessed data if it was built from this CSV by this code, else None"""
         try:
-            # Try different separators
-            separators = [',', ';', '\t', '|']
+            if not os.path.isfile(cache_path):
+                return None
+            import pyarrow.parquet as pq
             
-            for sep in separators:
-                try:
-                    df = pd.read_csv(file_path, sep=sep, encoding=encoding)
-                    if len(df.columns) > 1:  # Valid if more than 1 column
-                        break
-                except:
-                    continue
+            # Only the footer is read to check the tag
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(PARQUET_CACHE_KEY) != self._parquet_cache_tag(file_path, encoding):
+                return None
+            df = pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"⚠ Ignoring Parquet cache {cache_path}: {e}")
+            return None
+        
+        print(f"✓ Loaded {len(df)} preprocessed records from cache {cache_path}")
+        self.data = df
+        return df
+    
+    def _write_parquet_cache(self, df, file_path, cache_path, encoding):
+        """Save preprocessed data as a Snappy-compressed Parquet cache file tagged with its source"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
             
-            if df is None or len(df.columns) <= 1:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                   PARQUET_CACHE_KEY: self._parquet_cache_tag(file_path, encoding)})
+            pq.write_table(table, cache_path, compression='snappy')
+        except Exception as e:
+            print(f"⚠ Could not write Parquet cache {cache_path}: {e}")
+    
+    def _parse_csv(self, file_path, encoding):
+        """Parse and preprocess a CSV file in one read (Polars for large files)"""
+        if HAS_POLARS and encoding.lower() in ('utf-8', 'utf8') \
+                and os.path.isfile(file_path) and os.path.getsize(file_path) >= LAZY_MIN_BYTES:
+            df = self.preprocess_lazy(file_path)
+            if df is not None:
+                return df
+            print("⚠ Falling back to pandas")
+        
+        try:
+            return self.preprocess_data(self._read_csv_frame(file_path, encoding))
+        except Exception as e:
+            print(f"Error loading CSV file: {e}")
+            return None
+    
+    def parallel_load_csv(self, file_path, n_workers=None, encoding='utf-8'):
+        """
+        Load and preprocess a CSV file with pyarrow's multithreaded parser
+        
+        Unlike load_csv this always parses the file, bypassing the Parquet
+        cache and the Polars path. Requires pyarrow.
+        
+        Args:
+            file_path (str): Path to CSV file
+            n_workers (int): Number of parser threads (default: all CPUs)
+            encoding (str): File encoding
+            
+        Returns:
+            pd.DataFrame: Preprocessed data, or None if loading failed
+        """
+        try:
+            return self.preprocess_data(self._read_csv_frame(file_path, encoding, n_workers))
+        except Exception as e:
+            print(f"Error loading CSV file: {e}")
+            return None
+    
+    def _read_csv_frame(self, file_path, encoding, n_workers=None):
+        """Read a CSV file into a raw DataFrame, detecting its separator"""
+        self._prefetch(file_path)
+        # Detect the separator from the head of the file, then parse it once
+        sep = self.sniff_separator(file_path, encoding) or ','
+        if HAS_PYARROW:
+            df = self._read_csv_arrow(file_path, sep, encoding, n_workers)
+        else:
+            df = pd.read_csv(file_path, sep=sep, encoding=encoding)
+        
+        if len(df.columns) <= 1:
+            raise ValueError("Could not parse CSV file with any common separator")
+        
+        print(f"✓ Successfully loaded {len(df)} records from {file_path}")
+        print(f"Columns found: {list(df.columns)}")
+        return df
+    
+    def _read_csv_arrow(self, file_path, sep, encoding, n_workers=None):
+        """
+        Parse a CSV file with pyarrow.csv, splitting it into blocks parsed on n_workers threads
+        
+        Arrow parses the blocks with the GIL released. Empty strings become
+        missing values, as with pd.read_csv.
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        workers = n_workers or os.cpu_count() or 1
+        block_size = int(np.clip(os.path.getsize(file_path) // (workers * 4),
+                                 MIN_CSV_BLOCK_SIZE, MAX_CSV_BLOCK_SIZE))
+        read_options = pa_csv.ReadOptions(use_threads=True, block_size=block_size, encoding=encoding)
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        
+        cpu_count = pa.cpu_count()
+        if n_workers:
+            pa.set_cpu_count(n_workers)
+        try:
+            table = pa_csv.read_csv(file_path, read_options=read_options,
+                                    parse_options=pa_csv.ParseOptions(delimiter=sep),
+                                    convert_options=convert_options)
+        finally:
+            pa.set_cpu_count(cpu_count)
+        return table.to_pandas()
+    
+    def preprocess_lazy(self, file_path):
+        """
+        Load and preprocess a UTF-8 CSV file as a single Polars lazy query
+        
+        Produces the same columns as load_csv followed by preprocess_data, but
+        the renames, date parsing, row filter and derived columns are planned
+        together and collected once with the streaming engine.
+        Requires polars.
+        
+        Args:
+            file_path (str): Path to CSV file
+            
+        Returns:
+            pd.DataFrame: Preprocessed data, or None if loading failed
+        """
+        try:
+            import polars as pl
+            
+            sep = self.sniff_separator(file_path) or ','
+            lf = pl.scan_csv(file_path, separator=sep)
+            schema = lf.collect_schema()
+            if len(schema) <= 1:
                 raise ValueError("Could not parse CSV file with any common separator")
             
+            # Same column detection as _preprocess_frame
+            renames = {col: col.strip().replace(' ', '_') for col in schema.names()}
+            columns = list(renames.values())
+            date_columns = [col for col in columns if 'date' in col.lower() or 'time' in col.lower()]
+            date_col = date_columns[0] if date_columns else None
+            if date_col and 'Date' not in columns:
+                renames = {old: 'Date' if new == date_col else new for old, new in renames.items()}
+                columns = list(renames.values())
+                date_col = 'Date'
+            sales_columns = [col for col in columns if any(keyword in col.lower()
+                             for keyword in ['sales', 'revenue', 'amount', 'total', 'value'])]
+            if sales_columns and 'Total_Sales' not in columns:
+                renames = {old: 'Total_Sales' if new == sales_columns[0] else new for old, new in renames.items()}
+            lf = lf.rename(renames)
+            
+            if date_col and schema[next(old for old, new in renames.items() if new == date_col)] == pl.String:
+                lf = lf.with_columns(pl.col(date_col).str.to_datetime(strict=False))
+            
+            # Remove rows with all null values
+            lf = lf.filter(~pl.all_horizontal(pl.all().is_null()))
+            
+            if 'Date' in columns:
+                # Placeholders that keep the column order of the eager path; Period
+                # columns have no Polars equivalent, so the values are filled in below
+                lf = lf.with_columns(pl.lit(None).alias(col) for col in ('Month', 'Quarter', 'Year', 'DayOfWeek'))
+            
+            df = lf.collect(engine='streaming').to_pandas()
+            
+            if 'Date' in df.columns:
+                df['Date'] = df['Date'].astype('datetime64[ns]')
+                self._add_date_parts(df)
+            self._categorize(df)
+            
             print(f"✓ Successfully loaded {len(df)} records from {file_path}")
-            print(f"Columns found: {list(df.columns)}")
+            print(f"Final shape: {df.shape}")
             
-            return self.preprocess_data(df)
+            self.data = df
+            return df
             
         except Exception as e:
-            print(f"Error loading CSV file: {e}")
+            print(f"Error loading CSV file with polars: {e}")
+            return None
+    
+    def iter_csv(self, file_path, chunksize=100_000, encoding='utf-8'):
+        """
+        Stream a CSV file as preprocessed DataFrame chunks
+        
+        Args:
+            file_path (str): Path to CSV file
+            chunksize (int): Rows per chunk
+            encoding (str): File encoding
+            
+        Yields:
+            pd.DataFrame: Preprocessed chunk of at most chunksize rows
+        """
+        sep = self.sniff_separator(file_path, encoding) or ','
+        # The pyarrow engine cannot read in chunks, so this uses the C engine
+        with pd.read_csv(file_path, sep=sep, encoding=encoding, chunksize=chunksize) as reader:
+            for chunk in reader:
+                if len(chunk.columns) <= 1:
+                    raise ValueError("Could not parse CSV file with any common separator")
+                yield self._preprocess_frame(chunk)
+    
+    def _prefetch(self, file_path):
+        """Ask the kernel to start reading file_path into the page cache (see PREFETCH_FILES)"""
+        if not PREFETCH_FILES or not os.path.isfile(file_path):
+            return
+        
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            # The whole file is about to be parsed, so all of it is requested
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def sniff_separator(self, file_path, encoding='utf-8'):
+        """
+        Detect the field separator of a CSV file from its first SNIFF_BYTES
+        
+        Args:
+            file_path (str): Path to CSV file
+            encoding (str): File encoding
+            
+        Returns:
+            str: One of CSV_SEPARATORS, or None if it could not be detected
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(SNIFF_BYTES).decode(encoding, errors='replace')
+        
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=CSV_SEPARATORS).delimiter
+        except csv.Error:
             return None
     
     def load_excel(self, file_path, sheet_name=None):
@@ -83,51 +424,108 @@ class DataLoader:
             pd.DataFrame: Preprocessed data
         """
         try:
-            # Make a copy to avoid modifying original
-            df = df.copy()
-            
-            # Clean column names
-            df.columns = df.columns.str.strip().str.replace(' ', '_')
-            
-            # Try to identify date column
-            date_columns = [col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()]
-            if date_columns:
-                date_col = date_columns[0]
-                df[date_col] = pd.to_datetime(df[date_col], errors='coerce', infer_datetime_format=True)
-                if 'Date' not in df.columns:
-                    df.rename(columns={date_col: 'Date'}, inplace=True)
-            
-            # Try to identify sales/revenue columns
-            sales_columns = [col for col in df.columns if any(keyword in col.lower() 
-                           for keyword in ['sales', 'revenue', 'amount', 'total', 'value'])]
-            if sales_columns and 'Total_Sales' not in df.columns:
-                df.rename(columns={sales_columns[0]: 'Total_Sales'}, inplace=True)
-            
-            # Convert numeric columns
-            numeric_columns = df.select_dtypes(include=[np.number]).columns
-            for col in numeric_columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            # Remove rows with all NaN values
-            df.dropna(how='all', inplace=True)
-            
-            # Add derived date columns if Date exists
-            if 'Date' in df.columns:
-                df['Month'] = df['Date'].dt.to_period('M')
-                df['Quarter'] = df['Date'].dt.to_period('Q')
-                df['Year'] = df['Date'].dt.year
-                df['DayOfWeek'] = df['Date'].dt.day_name()
+            processed = self._categorize(self._preprocess_frame(df))
             
             print(f"✓ Data preprocessing completed")
-            print(f"Final shape: {df.shape}")
+            print(f"Final shape: {processed.shape}")
             
-            self.data = df
-            return df
+            self.data = processed
+            return processed
             
         except Exception as e:
             print(f"Error preprocessing data: {e}")
             return df
     
+    def _preprocess_frame(self, df):
+        """Clean, rename and derive columns for preprocess_data, returning a new DataFrame"""
+        # Make a copy to avoid modifying original
+        df = df.copy()
+        
+        # Clean column names
+        df.columns = df.columns.str.strip().str.replace(' ', '_')
+        
+        # Try to identify date column
+        date_columns = [col for col in df.columns if 'date' in col.lower() or 'time' in col.lower()]
+        if date_columns:
+            date_col = date_columns[0]
+            df[date_col] = self._parse_dates(df[date_col])
+            if 'Date' not in df.columns:
+                df.rename(columns={date_col: 'Date'}, inplace=True)
+        
+        # Try to identify sales/revenue columns
+        sales_columns = [col for col in df.columns if any(keyword in col.lower() 
+                       for keyword in ['sales', 'revenue', 'amount', 'total', 'value'])]
+        if sales_columns and 'Total_Sales' not in df.columns:
+            df.rename(columns={sales_columns[0]: 'Total_Sales'}, inplace=True)
+        
+        # Remove rows with all NaN values
+        df.dropna(how='all', inplace=True)
+        
+        # Add derived date columns if Date exists
+        if 'Date' in df.columns:
+            self._add_date_parts(df)
+        
+        return df
+    
+    def _add_date_parts(self, df):
+        """
+        Add Month and Quarter periods, Year and DayOfWeek derived from df['Date'] in place
+        
+        DayOfWeek is a categorical built from the weekday numbers, so no name
+        string is created per row and the categories are in weekday order.
+        """
+        dates = df['Date'].dt
+        df['Month'] = dates.to_period('M')
+        df['Quarter'] = dates.to_period('Q')
+        df['Year'] = dates.year
+        df['DayOfWeek'] = pd.Categorical.from_codes(dates.dayofweek.fillna(-1).astype(np.int8),
+                                                    categories=DAY_NAMES)
+    
+    def _categorize(self, df):
+        """
+        Convert the CATEGORICAL_COLUMNS of df to category dtype in place
+        
+        Chunks from iter_csv are left as objects and categorized after they
+        are concatenated, since chunks with different categories would
+        concatenate back to object dtype.
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+    
+    def _parse_dates(self, values):
+        """
+        Convert a column to datetime, unparseable values becoming NaT
+        
+        The format is guessed from a sample of the values, and the first guess
+        that parses the whole sample is passed to pd.to_datetime. Sales dates
+        repeat heavily, so each distinct value is parsed only once.
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        
+        # Look only at the head of the column; dropna() over all of it costs as much as parsing
+        sample = values.head(DATE_FORMAT_SAMPLE * 10).dropna().head(DATE_FORMAT_SAMPLE).astype(str)
+        with warnings.catch_warnings():
+            # Ambiguous day/month guesses warn; each guess is checked against the sample below
+            warnings.simplefilter('ignore')
+            formats = dict.fromkeys(guess_datetime_format(value) for value in sample)
+        
+        date_format = None
+        for candidate in formats:
+            if candidate and pd.to_datetime(sample, format=candidate, errors='coerce').notna().all():
+                date_format = candidate
+                break
+        
+        codes, uniques = pd.factorize(values)
+        parsed = pd.to_datetime(uniques, format=date_format, errors='coerce')
+        if getattr(parsed, 'tz', None) is not None:
+            return pd.to_datetime(values, format=date_format, errors='coerce')
+        # Missing values have code -1, which picks the appended NaT
+        return pd.Series(np.append(parsed.to_numpy(), np.datetime64('NaT'))[codes],
+                         index=values.index, name=values.name)
+    
     def generate_sample_data(self, num_records=1000, start_date='2023-01-01', end_date='2024-12-31'):
         """
         Generate sample sales data for testing
@@ -140,19 +538,21 @@ class DataLoader:
         Returns:
             pd.DataFrame: Generated sample data
         """
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
         # Date range
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
-        date_range = pd.date_range(start, end, freq='D')
+        # Dates are sampled as the int64 nanoseconds of the range and viewed as
+        # datetime64, without building a DatetimeIndex of the samples
+        date_range = pd.date_range(start, end, freq='D').asi8
         
         # Sample data parameters
-        products = ['Laptop', 'Desktop', 'Phone', 'Tablet', 'Monitor', 
-                   'Keyboard', 'Mouse', 'Headphones', 'Speaker', 'Camera']
-        regions = ['North America', 'South America', 'Europe', 'Asia', 'Africa', 'Oceania']
-        sales_reps = [f'Rep_{str(i).zfill(3)}' for i in range(1, 51)]
-        customers = [f'CUST_{str(i).zfill(4)}' for i in range(1000, 9999)]
+        products = np.array(['Laptop', 'Desktop', 'Phone', 'Tablet', 'Monitor', 
+                             'Keyboard', 'Mouse', 'Headphones', 'Speaker', 'Camera'])
+        regions = np.array(['North America', 'South America', 'Europe', 'Asia', 'Africa', 'Oceania'])
+        sales_reps = np.array([f'Rep_{str(i).zfill(3)}' for i in range(1, 51)])
+        customers = np.array([f'CUST_{str(i).zfill(4)}' for i in range(1000, 9999)])
         
         # Price ranges for different products
         price_ranges = {
@@ -168,36 +568,31 @@ class DataLoader:
             'Camera': (200, 2000)
         }
         
-        data = []
-        for _ in range(num_records):
-            product = np.random.choice(products)
-            min_price, max_price = price_ranges[product]
-            
-            record = {
-                'Date': np.random.choice(date_range),
-                'Product': product,
-                'Region': np.random.choice(regions),
-                'Sales_Rep': np.random.choice(sales_reps),
-                'Customer_ID': np.random.choice(customers),
-                'Quantity': np.random.randint(1, 20),
-                'Unit_Price': np.random.uniform(min_price, max_price),
-                'Discount': np.random.uniform(0, 0.2)  # 0-20% discount
-            }
-            
-            # Calculate total sales with discount
-            subtotal = record['Quantity'] * record['Unit_Price']
-            record['Total_Sales'] = subtotal * (1 - record['Discount'])
-            
-            data.append(record)
+        # Draw every column in one vectorized call; each row's price range is
+        # looked up by its product index
+        product_idx = rng.integers(0, len(products), num_records)
+        min_prices = np.array([price_ranges[product][0] for product in products], dtype=np.float64)
+        max_prices = np.array([price_ranges[product][1] for product in products], dtype=np.float64)
+        
+        quantity = rng.integers(1, 20, num_records)
+        unit_price, discount, total_sales = _sample_prices(product_idx, min_prices, max_prices, quantity,
+                                                           rng.random(num_records), rng.random(num_records))
         
-        df = pd.DataFrame(data)
-        df['Date'] = pd.to_datetime(df['Date'])
+        df = pd.DataFrame({
+            'Date': date_range[rng.integers(0, len(date_range), num_records)].view('datetime64[ns]'),
+            'Product': products[product_idx],
+            'Region': regions[rng.integers(0, len(regions), num_records)],
+            'Sales_Rep': sales_reps[rng.integers(0, len(sales_reps), num_records)],
+            'Customer_ID': customers[rng.integers(0, len(customers), num_records)],
+            'Quantity': quantity,
+            'Unit_Price': unit_price,
+            'Discount': discount,
+            # Total sales with discount
+            'Total_Sales': total_sales
+        })
         
         # Add derived columns
-        df['Month'] = df['Date'].dt.to_period('M')
-        df['Quarter'] = df['Date'].dt.to_period('Q')
-        df['Year'] = df['Date'].dt.year
-        df['DayOfWeek'] = df['Date'].dt.day_name()
+        self._add_date_parts(df)
         
         print(f"✓ Generated {len(df)} sample records")
         
@@ -254,10 +649,14 @@ class DataLoader:
         
         return validation_results
     
-    def get_data_info(self):
+    def get_data_info(self, deep_memory=False, include_missing=True):
         """
         Get information about the loaded data
         
+        Args:
+            deep_memory (bool): Include the Python objects of object columns in memory_usage
+            include_missing (bool): Include per-column missing value counts
+            
         Returns:
             dict: Data information
         """
@@ -267,16 +666,18 @@ class DataLoader:
         info = {
             'shape': self.data.shape,
             'columns': list(self.data.columns),
-            'memory_usage': self.data.memory_usage(deep=True).sum(),
-            'missing_values': self.data.isnull().sum().to_dict(),
-            'data_types': self.data.dtypes.to_dict()
+            'memory_usage': self.data.memory_usage(deep=deep_memory).sum()
         }
+        if include_missing:
+            info['missing_values'] = self.data.isna().sum().to_dict()
+        info['data_types'] = self.data.dtypes.to_dict()
         
         if 'Date' in self.data.columns:
+            start, end = self.data['Date'].min(), self.data['Date'].max()
             info['date_range'] = {
-                'start': self.data['Date'].min(),
-                'end': self.data['Date'].max(),
-                'days': (self.data['Date'].max() - self.data['Date'].min()).days
+                'start': start,
+                'end': end,
+                'days': (end - start).days
             }
         
         if 'Total_Sales' in self.data.columns:
@@ -4,16 +4,178 @@ Utility functions for data processing and analysis
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import importlib.util
 import re
 import warnings
 
+# Value prefixes detect_date_columns treats as dates, compiled once:
+# YYYY-MM-DD, MM/DD/YYYY, MM-DD-YYYY and YYYY/MM/DD
+DATE_VALUE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}|\d{4}/\d{2}/\d{2}')
+
+# polars is optional; frames of at least POLARS_MIN_ROWS rows with categorical
+# group keys compute the performance metrics as Polars queries evaluated
+# together (see ReportGenerator). Object keys cost more to convert than it saves.
+HAS_POLARS = importlib.util.find_spec('polars') is not None
+POLARS_MIN_ROWS = 200_000
+
+# numba is optional and imported only when a compiled kernel is first needed
+# (see compiled). Inputs shorter than NUMBA_MIN_ROWS use the numpy paths:
+# importing numba and loading the cached kernels costs more than the compiled
+# loops save on small data
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+NUMBA_MIN_ROWS = 100_000
+_compiled_kernels = {}
+
+# Largest group x member presence table (in bytes) group_nunique and the
+# compiled group_stats kernel may allocate
+MAX_BITSET_BYTES = 64 * 1024 * 1024
+
+class FrameCache(dict):
+    """
+    Results computed from one DataFrame, keyed by the caller
+    
+    The cache keeps a reference to its frame rather than the frame's id():
+    once a frame is freed its id can be reused by new data, which would then
+    be served stale results. Callers replace the cache when is_for() fails.
+    """
+    
+    def __init__(self, frame=None):
+        super().__init__()
+        self.frame = frame
+    
+    def is_for(self, frame):
+        """Return True if the cached results were computed from this very frame"""
+        return self.frame is frame
+
+def compiled(func):
+    """
+    Return func compiled with numba
+    
+    Compiled machine code is cached on disk (cache=True), so after the first
+    run only the cache lookup is paid, and only by inputs that reach
+    NUMBA_MIN_ROWS.
+    """
+    if func not in _compiled_kernels:
+        from numba import njit
+        _compiled_kernels[func] = njit(cache=True)(func)
+    return _compiled_kernels[func]
+
+def top_k_positions(values, k):
+    """
+    Positions of the k largest values, largest first
+    
+    Uses np.argpartition so only the selected k entries are sorted.
+    """
+    values = np.asarray(values)
+    if k >= values.size:
+        return np.argsort(-values, kind='stable')
+    candidates = np.argpartition(values, -k)[-k:]
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+def top_k(series, k):
+    """Return the k largest entries of a Series in descending order"""
+    return series.iloc[top_k_positions(series.to_numpy(), k)]
+
+def group_counts(codes, n_groups):
+    """Number of rows per group code (-1 for missing is skipped) with np.bincount"""
+    return np.bincount(codes[codes >= 0], minlength=n_groups)
+
+def group_sums(codes, values, n_groups):
+    """Sum of values per group code (-1 for missing is skipped, NaN counts as 0) with np.bincount"""
+    valid = codes >= 0
+    weights = np.nan_to_num(np.asarray(values, dtype=np.float64)[valid])
+    return np.bincount(codes[valid], weights=weights, minlength=n_groups)
+
+def group_nunique(group_codes, member_codes, n_groups, n_members):
+    """
+    Number of distinct member codes per group code (-1 for missing is skipped)
+    
+    Each (group, member) pair is marked in a presence table, or found with
+    np.unique when that table would exceed MAX_BITSET_BYTES.
+    """
+    valid = (group_codes >= 0) & (member_codes >= 0)
+    pairs = group_codes[valid].astype(np.int64) * n_members + member_codes[valid]
+    if n_groups * n_members <= MAX_BITSET_BYTES:
+        seen = np.zeros(n_groups * n_members, dtype=bool)
+        seen[pairs] = True
+        return seen.reshape(n_groups, n_members).sum(axis=1)
+    return np.bincount(np.unique(pairs) // max(n_members, 1), minlength=n_groups)
+
+def _group_stats_loop(group_codes, values, member_codes, n_groups, n_members):
+    """Per-group sum, row count and distinct member count in a single pass"""
+    sums = np.zeros(n_groups)
+    counts = np.zeros(n_groups, np.int64)
+    unique_members = np.zeros(n_groups, np.int64)
+    seen = np.zeros((n_groups, (n_members + 63) // 64), np.uint64)
+    
+    for i in range(group_codes.size):
+        group = group_codes[i]
+        if group < 0:
+            continue
+        counts[group] += 1
+        if not np.isnan(values[i]):
+            sums[group] += values[i]
+        
+        member = member_codes[i]
+        if member < 0:
+            continue
+        word = member >> 6
+        bit = np.uint64(1) << np.uint64(member & 63)
+        if seen[group, word] & bit == 0:
+            seen[group, word] |= bit
+            unique_members[group] += 1
+    
+    return sums, counts, unique_members
+
+def group_stats(group_codes, values, member_codes, n_groups, n_members):
+    """
+    Compute per-group sum of values, row count and number of distinct members
+    
+    Uses a fused Numba kernel for large inputs when numba is installed and
+    the per-group membership bitset stays small, falling back to the numpy
+    group_sums, group_counts and group_nunique otherwise.
+    
+    Args:
+        group_codes (np.ndarray): Factorized group keys (-1 for missing)
+        values (np.ndarray): Values to sum per group
+        member_codes (np.ndarray): Factorized members to count distinct (-1 for missing)
+        n_groups (int): Number of distinct groups
+        n_members (int): Number of distinct members
+        
+    Returns:
+        tuple: (sums, counts, unique_members) arrays of length n_groups
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if HAS_NUMBA and group_codes.size >= NUMBA_MIN_ROWS \
+            and n_groups * ((n_members + 63) // 64) * 8 <= MAX_BITSET_BYTES:
+        return compiled(_group_stats_loop)(group_codes, values, member_codes, n_groups, n_members)
+    return (group_sums(group_codes, values, n_groups), group_counts(group_codes, n_groups),
+            group_nunique(group_codes, member_codes, n_groups, n_members))
+
+def _copy_for_update(df):
+    """
+    Copy df before adding or replacing columns
+    
+    Under Copy-on-Write (the default from pandas 3.0, enabled by main.py) a
+    shallow copy is enough: columns that are not replaced stay shared with
+    the input until either side modifies them. Otherwise every block is copied.
+    """
+    copy_on_write = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+    return df.copy(deep=not copy_on_write)
+
 class DataProcessor:
-    """Data processing utilities"""
+    """
+    Data processing utilities
+    
+    Methods return new DataFrames and never modify their input. They work on
+    copies from _copy_for_update, which are shallow under Copy-on-Write, so
+    only the columns they replace are allocated anew.
+    """
     
     @staticmethod
     def clean_column_names(df):
         """Clean and standardize column names"""
-        df = df.copy()
+        df = _copy_for_update(df)
         
         # Remove special characters and spaces
         df.columns = df.columns.str.replace(r'[^\w\s]', '', regex=True)
@@ -36,26 +198,18 @@ class DataProcessor:
                 date_columns.append(col)
                 continue
             
-            # Check data content for date-like patterns
-            sample_data = df[col].dropna().astype(str).head(10)
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-                r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-                r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-            ]
-            
-            for pattern in date_patterns:
-                if any(re.match(pattern, str(val)) for val in sample_data):
-                    date_columns.append(col)
-                    break
+            # Check data content for date-like patterns; only the sampled
+            # values are converted to strings
+            sample_data = df[col].dropna().head(10).astype(str)
+            if sample_data.str.match(DATE_VALUE_PATTERN).any():
+                date_columns.append(col)
         
         return list(set(date_columns))
     
     @staticmethod
     def convert_to_numeric(df, columns=None):
         """Convert columns to numeric, handling common formatting issues"""
-        df = df.copy()
+        df = _copy_for_update(df)
         
         if columns is None:
             columns = df.select_dtypes(include=['object']).columns
@@ -75,26 +229,29 @@ class DataProcessor:
     @staticmethod
     def handle_missing_values(df, strategy='auto'):
         """Handle missing values with different strategies"""
-        df = df.copy()
-        
         if strategy == 'auto':
-            for col in df.columns:
-                if df[col].dtype in ['int64', 'float64']:
-                    # Numeric columns: fill with median
-                    df[col].fillna(df[col].median(), inplace=True)
-                else:
-                    # Categorical columns: fill with mode or 'Unknown'
-                    mode_val = df[col].mode()
-                    if len(mode_val) > 0:
-                        df[col].fillna(mode_val[0], inplace=True)
-                    else:
-                        df[col].fillna('Unknown', inplace=True)
+            # Only columns with gaps need statistics; all of them are filled in one call
+            missing = df.columns[df.isna().any()]
+            numeric = df[missing].select_dtypes(include=[np.number])
+            
+            # Numeric columns: fill with median
+            fill_values = numeric.median().to_dict()
+            
+            # Categorical columns: fill with mode or 'Unknown'
+            for col in missing.difference(numeric.columns, sort=False):
+                mode_val = df[col].mode()
+                fill_values[col] = mode_val.iat[0] if len(mode_val) > 0 else 'Unknown'
+            
+            df = df.fillna(fill_values)
         
         elif strategy == 'drop':
-            df.dropna(inplace=True)
+            df = df.dropna()
         
         elif strategy == 'forward_fill':
-            df.fillna(method='ffill', inplace=True)
+            df = df.ffill()
+        
+        else:
+            df = _copy_for_update(df)
         
         return df
     
@@ -106,61 +263,90 @@ class DataProcessor:
         if columns is None:
             columns = df.select_dtypes(include=[np.number]).columns
         
-        for col in columns:
-            if col in df.columns:
-                if method == 'iqr':
-                    Q1 = df[col].quantile(0.25)
-                    Q3 = df[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    
-                    lower_bound = Q1 - threshold * IQR
-                    upper_bound = Q3 + threshold * IQR
-                    
-                    outliers[col] = df[(df[col] < lower_bound) | (df[col] > upper_bound)].index.tolist()
+        columns = [col for col in columns if col in df.columns]
+        if method not in ('iqr', 'zscore') or not columns:
+            return outliers
+        
+        # All columns are tested at once on one 2-D float array
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if method == 'iqr':
+                Q1, Q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+                IQR = Q3 - Q1
                 
-                elif method == 'zscore':
-                    z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-                    outliers[col] = df[z_scores > threshold].index.tolist()
+                lower_bound = Q1 - threshold * IQR
+                upper_bound = Q3 + threshold * IQR
+                
+                mask = (values < lower_bound) | (values > upper_bound)
+            
+            else:
+                z_scores = np.abs((values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0, ddof=1))
+                mask = z_scores > threshold
+        
+        for i, col in enumerate(columns):
+            outliers[col] = df.index[mask[:, i]].tolist()
         
         return outliers
     
     @staticmethod
     def create_time_features(df, date_col):
         """Create additional time-based features from date column"""
-        df = df.copy()
+        if date_col not in df.columns:
+            return _copy_for_update(df)
         
-        if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col])
-            
+        dates = pd.to_datetime(df[date_col])
+        day_of_week = dates.dt.dayofweek
+        
+        # All features are added in a single assign rather than one insert per column
+        return df.assign(**{
+            date_col: dates,
             # Extract time components
-            df[f'{date_col}_Year'] = df[date_col].dt.year
-            df[f'{date_col}_Month'] = df[date_col].dt.month
-            df[f'{date_col}_Quarter'] = df[date_col].dt.quarter
-            df[f'{date_col}_DayOfWeek'] = df[date_col].dt.dayofweek
-            df[f'{date_col}_DayOfYear'] = df[date_col].dt.dayofyear
-            df[f'{date_col}_WeekOfYear'] = df[date_col].dt.isocalendar().week
-            df[f'{date_col}_IsWeekend'] = df[date_col].dt.dayofweek.isin([5, 6])
-            
+            f'{date_col}_Year': dates.dt.year,
+            f'{date_col}_Month': dates.dt.month,
+            f'{date_col}_Quarter': dates.dt.quarter,
+            f'{date_col}_DayOfWeek': day_of_week,
+            f'{date_col}_DayOfYear': dates.dt.dayofyear,
+            f'{date_col}_WeekOfYear': dates.dt.isocalendar().week,
+            f'{date_col}_IsWeekend': day_of_week.isin([5, 6]),
             # Create readable day names
-            df[f'{date_col}_DayName'] = df[date_col].dt.day_name()
-            df[f'{date_col}_MonthName'] = df[date_col].dt.month_name()
-        
-        return df
+            f'{date_col}_DayName': dates.dt.day_name(),
+            f'{date_col}_MonthName': dates.dt.month_name()
+        })
     
     @staticmethod
     def calculate_moving_averages(df, value_col, windows=[7, 30, 90]):
-        """Calculate moving averages for a value column"""
-        df = df.copy()
+        """
+        Calculate moving averages for a value column
+        
+        Equivalent to rolling(window, min_periods=1).mean() for each window,
+        with missing values skipped, but every window is read off one shared
+        running sum and count instead of scanning the column once per window.
+        """
+        df = _copy_for_update(df)
+        
+        values = df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        running_sum = np.cumsum(np.where(valid, values, 0.0))
+        running_count = np.cumsum(valid)
         
         for window in windows:
-            df[f'{value_col}_MA_{window}'] = df[value_col].rolling(window=window, min_periods=1).mean()
+            # Window sums are differences of the running totals; the first
+            # window - 1 rows average everything seen so far
+            sums = running_sum.copy()
+            counts = running_count.copy()
+            sums[window:] -= running_sum[:-window]
+            counts[window:] -= running_count[:-window]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = sums / counts
+            means[counts == 0] = np.nan
+            df[f'{value_col}_MA_{window}'] = means
         
         return df
     
     @staticmethod
     def create_categorical_features(df, columns, encoding='label'):
         """Create categorical features with different encoding methods"""
-        df = df.copy()
+        df = _copy_for_update(df)
         
         for col in columns:
             if col in df.columns:
@@ -191,11 +377,7 @@ class ReportGenerator:
         
         # Basic metrics
         if 'Total_Sales' in self.data.columns:
-            summary['total_sales'] = self.data['Total_Sales'].sum()
-            summary['avg_sale'] = self.data['Total_Sales'].mean()
-            summary['median_sale'] = self.data['Total_Sales'].median()
-            summary['max_sale'] = self.data['Total_Sales'].max()
-            summary['min_sale'] = self.data['Total_Sales'].min()
+            summary.update(self._sales_stats(self.data['Total_Sales']))
         
         summary['total_transactions'] = len(self.data)
         summary['unique_customers'] = self.data['Customer_ID'].nunique() if 'Customer_ID' in self.data.columns else 'N/A'
@@ -203,40 +385,126 @@ class ReportGenerator:
         
         # Date range
         if 'Date' in self.data.columns:
+            start, end = self.data['Date'].min(), self.data['Date'].max()
             summary['date_range'] = {
-                'start': self.data['Date'].min(),
-                'end': self.data['Date'].max(),
-                'days': (self.data['Date'].max() - self.data['Date'].min()).days
+                'start': start,
+                'end': end,
+                'days': (end - start).days
             }
         
         return summary
     
+    @staticmethod
+    def _sales_stats(sales):
+        """
+        Sum, mean, median, max and min of a sales column, skipping missing values
+        
+        Numeric columns are reduced on their numpy array: missing values are
+        dropped once and the mean is derived from the sum instead of another scan.
+        """
+        values = sales.to_numpy() if isinstance(sales.dtype, np.dtype) and sales.dtype.kind in 'iuf' else None
+        total = None
+        if values is not None and values.dtype.kind == 'f':
+            valid = ~np.isnan(values)
+            if not valid.all():
+                # Zero-filled like pandas, so the sum rounds the same way
+                total = np.where(valid, values, 0).sum()
+                values = values[valid]
+        
+        if values is None or values.size == 0:
+            return {
+                'total_sales': sales.sum(),
+                'avg_sale': sales.mean(),
+                'median_sale': sales.median(),
+                'max_sale': sales.max(),
+                'min_sale': sales.min()
+            }
+        
+        if total is None:
+            total = values.sum()
+        return {
+            'total_sales': total,
+            'avg_sale': total / values.size,
+            'median_sale': np.median(values),
+            'max_sale': values.max(),
+            'min_sale': values.min()
+        }
+    
     def generate_performance_metrics(self):
         """Generate performance metrics by different dimensions"""
         metrics = {}
-        
-        # Product performance
-        if 'Product' in self.data.columns and 'Total_Sales' in self.data.columns:
-            metrics['product_performance'] = self.data.groupby('Product').agg({
-                'Total_Sales': ['sum', 'mean', 'count'],
-                'Customer_ID': 'nunique' if 'Customer_ID' in self.data.columns else lambda x: len(x)
-            }).round(2)
-        
-        # Regional performance
-        if 'Region' in self.data.columns and 'Total_Sales' in self.data.columns:
-            metrics['regional_performance'] = self.data.groupby('Region').agg({
-                'Total_Sales': ['sum', 'mean', 'count']
-            }).round(2)
-        
-        # Sales rep performance
-        if 'Sales_Rep' in self.data.columns and 'Total_Sales' in self.data.columns:
-            metrics['sales_rep_performance'] = self.data.groupby('Sales_Rep').agg({
-                'Total_Sales': ['sum', 'mean', 'count'],
-                'Customer_ID': 'nunique' if 'Customer_ID' in self.data.columns else lambda x: len(x)
-            }).round(2).sort_values(('Total_Sales', 'sum'), ascending=False)
+        if 'Total_Sales' not in self.data.columns:
+            return metrics
+        
+        # Product, regional and sales rep performance: (group key, count distinct customers)
+        dimensions = {name: spec for name, spec in [
+            ('product_performance', ('Product', True)),
+            ('regional_performance', ('Region', False)),
+            ('sales_rep_performance', ('Sales_Rep', True)),
+        ] if spec[0] in self.data.columns}
+        
+        if HAS_POLARS and 'Customer_ID' in self.data.columns and len(self.data) >= POLARS_MIN_ROWS \
+                and all(isinstance(self.data[key].dtype, pd.CategoricalDtype) for key, _ in dimensions.values()):
+            tables = self._performance_tables_polars(dimensions)
+        else:
+            tables = {}
+            for name, (key, with_customers) in dimensions.items():
+                aggregations = {'Total_Sales': ['sum', 'mean', 'count']}
+                if with_customers:
+                    aggregations['Customer_ID'] = 'nunique' if 'Customer_ID' in self.data.columns else lambda x: len(x)
+                tables[name] = self.data.groupby(key, observed=True).agg(aggregations)
+        
+        for name, table in tables.items():
+            metrics[name] = table.round(2)
+        if 'sales_rep_performance' in metrics:
+            metrics['sales_rep_performance'] = metrics['sales_rep_performance'].sort_values(
+                ('Total_Sales', 'sum'), ascending=False)
         
         return metrics
     
+    def _performance_tables_polars(self, dimensions):
+        """
+        Compute the generate_performance_metrics tables as Polars queries
+        
+        The queries run together with pl.collect_all over one conversion of
+        the needed columns, and each result is laid out like the pandas
+        groupby().agg() table it replaces.
+        """
+        import polars as pl
+        
+        keys = [key for key, _ in dimensions.values()]
+        frame = pl.from_pandas(self.data[keys + ['Total_Sales', 'Customer_ID']]).lazy()
+        
+        queries = []
+        for key, with_customers in dimensions.values():
+            aggregations = [pl.col('Total_Sales').sum().alias('sum'),
+                            pl.col('Total_Sales').mean().alias('mean'),
+                            pl.col('Total_Sales').count().cast(pl.Int64).alias('count')]
+            if with_customers:
+                aggregations.append(pl.col('Customer_ID').drop_nulls().n_unique().cast(pl.Int64).alias('nunique'))
+            queries.append(frame.drop_nulls(key).group_by(key).agg(aggregations))
+        
+        tables = {}
+        for name, result in zip(dimensions, pl.collect_all(queries)):
+            key, with_customers = dimensions[name]
+            table = result.to_pandas().set_index(key)
+            table.columns = pd.MultiIndex.from_tuples(
+                [('Total_Sales', 'sum'), ('Total_Sales', 'mean'), ('Total_Sales', 'count')]
+                + ([('Customer_ID', 'nunique')] if with_customers else []))
+            
+            # Same group order and index type as groupby(observed=True)
+            groups = self.data[key]
+            if isinstance(groups.dtype, pd.CategoricalDtype):
+                observed = groups.cat.categories[groups.cat.categories.isin(table.index)]
+                table = table.reindex(observed)
+                table.index = pd.CategoricalIndex(table.index, categories=groups.cat.categories,
+                                                  ordered=groups.cat.ordered, name=key)
+            else:
+                table = table.sort_index()
+            tables[name] = table
+        
+        return tables
+    
     def export_to_excel(self, filename, include_charts=False):
         """Export analysis results to Excel file"""
         try:
@@ -289,17 +557,20 @@ class ValidationUtils:
             validation_results['is_valid'] = False
             return validation_results
         
-        # Date validation
+        # Date validation; the column is parsed at most once and only if it is not datetime already
         if 'Date' in df.columns:
-            try:
-                pd.to_datetime(df['Date'])
-            except:
-                validation_results['warnings'].append("Date column contains invalid dates")
+            dates = df['Date']
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                try:
+                    dates = pd.to_datetime(dates)
+                except:
+                    validation_results['warnings'].append("Date column contains invalid dates")
+                    dates = pd.to_datetime(dates, errors='coerce')
             
             # Check for future dates
-            future_dates = pd.to_datetime(df['Date']) > datetime.now()
-            if future_dates.any():
-                validation_results['warnings'].append(f"{future_dates.sum()} records have future dates")
+            future_count = np.count_nonzero((dates > datetime.now()).to_numpy())
+            if future_count:
+                validation_results['warnings'].append(f"{future_count} records have future dates")
         
         # Sales amount validation
         if 'Total_Sales' in df.columns:
@@ -315,4 +586,64 @@ class ValidationUtils:
         duplicates = df.duplicated().sum()
         if duplicates > 0:
             validation_results['warnings'].append(f"{duplicates} duplicate records found")
-            validation_results['suggestions
\ No newline at end of file
+            validation_results['suggestions'].append("Consider removing duplicate records")
+        
+        return validation_results
+    
+    @staticmethod
+    def data_quality_score(df):
+        """
+        Score data quality from 0 to 100
+        
+        The score is the mean of three shares, as percentages: cells that are
+        not missing, rows that are not duplicates, and rows whose Total_Sales
+        is not negative.
+        
+        Returns:
+            float: Quality score (0 for an empty dataset)
+        """
+        if df.size == 0:
+            return 0.0
+        
+        completeness = 1 - df.isna().to_numpy().sum() / df.size
+        uniqueness = 1 - df.duplicated().sum() / len(df)
+        validity = 1 - (df['Total_Sales'] < 0).sum() / len(df) if 'Total_Sales' in df.columns else 1.0
+        return float(100 * (completeness + uniqueness + validity) / 3)
+
+class PerformanceUtils:
+    """Performance optimization utilities"""
+    
+    @staticmethod
+    def optimize_dataframe(df, categorical_columns=None, categorical_threshold=0.5):
+        """
+        Reduce dataframe memory usage by downcasting column dtypes
+        
+        Integer and float columns are downcast to the smallest type that holds
+        their values, and string columns become categoricals when they are
+        listed in categorical_columns or have few unique values. The dataframe
+        is modified in place and returned.
+        
+        Args:
+            df (pd.DataFrame): Data to optimize
+            categorical_columns (list): Columns to always convert to category
+            categorical_threshold (float): Max unique/total ratio for other
+                string columns to be converted to category
+            
+        Returns:
+            pd.DataFrame: Optimized data
+        """
+        if categorical_columns is None:
+            categorical_columns = ['Product', 'Region', 'Sales_Rep', 'Customer_ID']
+        
+        for col in df.select_dtypes(include=['integer']).columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        for col in df.select_dtypes(include=['floating']).columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        
+        num_rows = max(len(df), 1)
+        for col in df.select_dtypes(include=['object']).columns:
+            if col in categorical_columns or df[col].nunique() / num_rows < categorical_threshold:
+                df[col] = df[col].astype('category')
+        
+        return df
@@ -2,15 +2,96 @@
 Advanced visualization components for the Sales Analysis Tool
 """
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
+import importlib.util
 import os
 from config import COLORS, PLOTLY_CONFIG, CHARTS_DIR
+try:
+    from .utils import FrameCache
+except ImportError:  # imported as a top-level module with src on sys.path
+    from utils import FrameCache
+
+# datashader is optional; scatter matrices of at least RASTER_MIN_ROWS rows are
+# drawn as RASTER_BINS x RASTER_BINS point-count heatmaps instead of one marker
+# per point, so their size no longer grows with the number of rows
+HAS_DATASHADER = importlib.util.find_spec('datashader') is not None
+RASTER_MIN_ROWS = 50_000
+RASTER_BINS = 100
+
+# float64 chart values are sent to Plotly as float32 only when none moves by
+# more than half a cent, so hover text and tables show the same amounts
+PLOT_FLOAT32_ATOL = 0.005
+
+def _plot_array(values):
+    """
+    Return a Series or DataFrame as a numpy array for a Plotly trace
+    
+    Plotly sends numeric numpy arrays to the browser base64-encoded instead of
+    as JSON lists, and already narrows integers to the smallest type that
+    holds them. float64 is sent as float32, halving the payload, when every
+    value survives the round trip within PLOT_FLOAT32_ATOL; float32 keeps only
+    ~7 significant digits, so e.g. totals in the millions stay float64.
+    """
+    array = values.to_numpy()
+    if array.dtype != np.float64:
+        return array
+    
+    with np.errstate(over='ignore', invalid='ignore'):
+        narrowed = array.astype(np.float32)
+        if np.allclose(narrowed, array, rtol=0, atol=PLOT_FLOAT32_ATOL, equal_nan=True):
+            return narrowed
+    return array
+
+class _GroupByCache:
+    """
+    GroupBy objects of one DataFrame, memoized by their keys
+    
+    A GroupBy factorizes its keys on first use and keeps the result, so
+    charts grouping by the same columns share that work. The cache is
+    dropped when it is asked for groups of a different DataFrame. Groups
+    are sorted, but unused categories of categorical keys are left out.
+    """
+    
+    def __init__(self):
+        self._groupbys = FrameCache()
+    
+    def get(self, data, keys, freq=None):
+        """
+        Return data grouped by keys
+        
+        Args:
+            data (pd.DataFrame): Data to group
+            keys (str or tuple): Column name(s) to group by
+            freq (str): If given, the first key is a date column binned at
+                this frequency; daily bins alongside other keys are the
+                floored dates, other bins come from pd.Grouper
+            
+        Returns:
+            DataFrameGroupBy: Shared between callers, so do not modify it
+        """
+        if not self._groupbys.is_for(data):
+            self._groupbys = FrameCache(data)
+        
+        cache_key = (keys, freq)
+        if cache_key not in self._groupbys:
+            if freq == 'D' and not isinstance(keys, str):
+                # Grouping on the floored dates hashes them like any other key,
+                # where a Grouper among several keys goes through resample's binning
+                day = data[keys[0]].dt.floor('D')
+                self._groupbys[cache_key] = data.groupby([day, *keys[1:]], observed=True)
+            elif freq is not None and isinstance(keys, str):
+                self._groupbys[cache_key] = data.groupby(pd.Grouper(key=keys, freq=freq), observed=True)
+            elif freq is not None:
+                self._groupbys[cache_key] = data.groupby([pd.Grouper(key=keys[0], freq=freq), *keys[1:]],
+                                                         observed=True)
+            else:
+                self._groupbys[cache_key] = data.groupby(keys if isinstance(keys, str) else list(keys),
+                                                         observed=True)
+        return self._groupbys[cache_key]
 
 class ChartGenerator:
     """Advanced chart generation class with customization options"""
@@ -19,6 +100,11 @@ class ChartGenerator:
         self.data = data
         self.theme = theme
         self.color_palette = COLORS['palette']
+        # Looked up once for the waterfall and gauge markers
+        self._primary = COLORS['primary']
+        self._success = COLORS['success']
+        self._danger = COLORS['danger']
+        self._groupbys = _GroupByCache()
     
     def set_data(self, data):
         """Set the data for visualization"""
@@ -40,17 +126,24 @@ class ChartGenerator:
         
         # Prepare data
         if group_col:
-            grouped_data = self.data.groupby([pd.Grouper(key=date_col, freq='D'), group_col])[value_col].agg(aggregate).reset_index()
+            grouped_data = self._groupbys.get(self.data, (date_col, group_col), freq='D')[value_col].agg(aggregate).reset_index()
             
             fig = px.line(grouped_data, x=date_col, y=value_col, color=group_col,
                          title=f'{value_col} Trend by {group_col}',
                          color_discrete_sequence=self.color_palette)
         else:
-            daily_data = self.data.groupby(date_col)[value_col].agg(aggregate).reset_index()
+            daily_data = self._groupbys.get(self.data, date_col)[value_col].agg(aggregate)
             
-            fig = px.line(daily_data, x=date_col, y=value_col,
-                         title=f'{value_col} Trend Over Time',
-                         color_discrete_sequence=[COLORS['primary']])
+            # A single trace needs none of px.line's DataFrame handling
+            fig = go.Figure(go.Scatter(
+                x=daily_data.index.to_numpy(),
+                y=_plot_array(daily_data),
+                mode='lines',
+                line_color=self._primary,
+                hovertemplate=f'{date_col}=%{{x}}<br>{value_col}=%{{y}}<extra></extra>'
+            ))
+            fig.update_layout(title=f'{value_col} Trend Over Time',
+                              xaxis_title=date_col, yaxis_title=value_col)
         
         # Add range selector
         fig.update_layout(
@@ -75,30 +168,40 @@ class ChartGenerator:
         if self.data is None:
             raise ValueError("No data provided")
         
-        # Prepare cohort data
-        data = self.data.copy()
-        data['Order_Period'] = data[date_col].dt.to_period('M')
-        data['Cohort_Group'] = data.groupby(customer_col)[date_col].transform('min').dt.to_period('M')
+        # Prepare cohort data; months are kept as integer Period ordinals and
+        # only converted back to Periods for the labels
+        data = self.data.loc[self.data[date_col].notna(), [customer_col, date_col]]
+        data['Order_Period'] = data[date_col].dt.to_period('M').array.asi8
+        data['Cohort_Group'] = data.groupby(customer_col, observed=True, sort=False)['Order_Period'].transform('min')
         
         # Calculate period number
-        data['Period_Number'] = (data['Order_Period'] - data['Cohort_Group']).apply(attrgetter('n'))
+        data['Period_Number'] = data['Order_Period'] - data['Cohort_Group']
         
-        # Create cohort table
-        cohort_data = data.groupby(['Cohort_Group', 'Period_Number'])[customer_col].nunique().reset_index()
+        # Create cohort table; pivot sorts the cohorts and periods, so the groups need not be
+        cohort_data = data.groupby(['Cohort_Group', 'Period_Number'], sort=False)[customer_col].nunique().reset_index()
         cohort_counts = cohort_data.pivot(index='Cohort_Group', columns='Period_Number', values=customer_col)
         
         # Calculate cohort sizes
-        cohort_sizes = data.groupby('Cohort_Group')[customer_col].nunique()
+        cohort_sizes = data.groupby('Cohort_Group', sort=False)[customer_col].nunique()
         cohort_table = cohort_counts.divide(cohort_sizes, axis=0)
+        cohort_table.index = pd.PeriodIndex(pd.arrays.PeriodArray(cohort_table.index.to_numpy(), dtype='period[M]'),
+                                            name='Cohort_Group')
+        
+        # Create heatmap; cells are labelled from z in the browser, and the
+        # oldest cohort stays on top as in a retention table
+        fig = go.Figure(go.Heatmap(
+            z=cohort_table.to_numpy(np.float32),
+            x=cohort_table.columns.astype(str),
+            y=cohort_table.index.astype(str),
+            colorscale='Blues',
+            texttemplate='%{z:.1%}',
+            hovertemplate='Cohort %{y}<br>Period %{x}<br>Retention %{z:.1%}<extra></extra>'
+        ))
+        fig.update_layout(title='Cohort Analysis - Customer Retention',
+                          xaxis_title='Period Number', yaxis_title='Cohort Group',
+                          yaxis_autorange='reversed')
         
-        # Create heatmap
-        plt.figure(figsize=(15, 8))
-        sns.heatmap(cohort_table, annot=True, fmt='.1%', cmap='Blues')
-        plt.title('Cohort Analysis - Customer Retention')
-        plt.ylabel('Cohort Group')
-        plt.xlabel('Period Number')
-        
-        return plt.gcf()
+        return fig
     
     def create_funnel_chart(self, stages, values, title="Sales Funnel"):
         """Create a funnel chart for sales process analysis"""
@@ -121,12 +224,13 @@ class ChartGenerator:
         if self.data is None:
             raise ValueError("No data provided")
         
-        treemap_data = self.data.groupby(data_col)[size_col].sum().reset_index()
-        
+        # Sizes and colours come from one aggregation, so no merge is needed
+        aggregations = {size_col: 'sum'}
         if color_col and color_col in self.data.columns:
-            color_data = self.data.groupby(data_col)[color_col].mean().reset_index()
-            treemap_data = treemap_data.merge(color_data, on=data_col)
-            
+            aggregations[color_col] = 'mean'
+        treemap_data = self._groupbys.get(self.data, data_col).agg(aggregations).reset_index()
+        
+        if color_col in aggregations:
             fig = px.treemap(treemap_data, path=[data_col], values=size_col,
                            color=color_col, color_continuous_scale='Viridis',
                            title=title)
@@ -147,9 +251,9 @@ class ChartGenerator:
             text=[f"+{v}" if v > 0 else str(v) for v in values],
             y=values,
             connector={"line": {"color": "rgb(63, 63, 63)"}},
-            decreasing={"marker": {"color": COLORS['danger']}},
-            increasing={"marker": {"color": COLORS['success']}},
-            totals={"marker": {"color": COLORS['primary']}}
+            decreasing={"marker": {"color": self._danger}},
+            increasing={"marker": {"color": self._success}},
+            totals={"marker": {"color": self._primary}}
         ))
         
         fig.update_layout(title=title, showlegend=False)
@@ -165,7 +269,7 @@ class ChartGenerator:
             delta={'reference': target if target else max_value * 0.8},
             gauge={
                 'axis': {'range': [None, max_value]},
-                'bar': {'color': COLORS['primary']},
+                'bar': {'color': self._primary},
                 'steps': [
                     {'range': [0, max_value * 0.5], 'color': "lightgray"},
                     {'range': [max_value * 0.5, max_value * 0.8], 'color': "gray"}
@@ -188,11 +292,51 @@ class ChartGenerator:
         # Filter numeric columns
         numeric_data = self.data[columns].select_dtypes(include=[np.number])
         
+        if HAS_DATASHADER and len(numeric_data) >= RASTER_MIN_ROWS:
+            return self._rasterized_scatter_matrix(numeric_data)
+        
         fig = px.scatter_matrix(numeric_data, 
                                title="Scatter Plot Matrix",
                                color_discrete_sequence=self.color_palette)
         
-        fig.update_traces(diagonal_visible=False)
+        # The upper half mirrors the lower one, so only the lower half is drawn
+        fig.update_traces(diagonal_visible=False, showupperhalf=False)
+        return fig
+    
+    def _rasterized_scatter_matrix(self, numeric_data):
+        """
+        Draw a scatter matrix as one datashader point-count heatmap per pair of columns
+        
+        Bins without points are left transparent. As in create_scatter_matrix,
+        only the panels below the diagonal are drawn.
+        """
+        import datashader as ds
+        
+        columns = list(numeric_data.columns)
+        k = len(columns)
+        fig = make_subplots(rows=k, cols=k, shared_xaxes=True, shared_yaxes=True,
+                            horizontal_spacing=0.02, vertical_spacing=0.02)
+        canvas = ds.Canvas(plot_width=RASTER_BINS, plot_height=RASTER_BINS)
+        
+        for i, y_col in enumerate(columns):
+            for j, x_col in enumerate(columns[:i]):
+                counts = canvas.points(numeric_data, x_col, y_col, agg=ds.count())
+                z = counts.to_numpy().astype(np.float32)
+                z[z == 0] = np.nan
+                fig.add_trace(go.Heatmap(
+                    x=counts.coords[x_col].to_numpy(),
+                    y=counts.coords[y_col].to_numpy(),
+                    z=z,
+                    colorscale='Viridis',
+                    showscale=False,
+                    hovertemplate=f'{x_col}=%{{x}}<br>{y_col}=%{{y}}<br>points=%{{z}}<extra></extra>'
+                ), row=i + 1, col=j + 1)
+        
+        for idx, col in enumerate(columns[:-1]):
+            fig.update_xaxes(title_text=col, row=k, col=idx + 1)
+            fig.update_yaxes(title_text=columns[idx + 1], row=idx + 2, col=1)
+        
+        fig.update_layout(title="Scatter Plot Matrix")
         return fig
     
     def create_animated_bar_race(self, date_col, category_col, value_col, 
@@ -201,23 +345,45 @@ class ChartGenerator:
         if self.data is None:
             raise ValueError("No data provided")
         
-        # Prepare data for animation
-        data = self.data.copy()
-        data[date_col] = pd.to_datetime(data[date_col])
-        
-        # Group by date and category
-        anim_data = data.groupby([date_col, category_col])[value_col].sum().reset_index()
-        
-        # Create animated bar chart
-        fig = px.bar(anim_data, x=value_col, y=category_col, 
-                    animation_frame=date_col.replace(' ', '_'),
-                    title=title,
-                    orientation='h',
-                    color=category_col,
-                    color_discrete_sequence=self.color_palette)
-        
-        fig.layout.updatemenus[0].buttons[0].args[1]['frame']['duration'] = 1000
-        fig.layout.updatemenus[0].buttons[0].args[1]['transition']['duration'] = 300
+        # Dates are only parsed when they are not datetimes already
+        dates = self.data[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        
+        # Group by date and category into a dates x categories table; a
+        # category without sales on a date is NaN and gets no bar
+        anim_data = self.data.groupby([dates, category_col], observed=True)[value_col].sum().unstack(category_col)
+        categories = anim_data.columns.to_numpy()
+        colors = [self.color_palette[i % len(self.color_palette)] for i in range(len(categories))]
+        names = [str(date) for date in anim_data.index]
+        values = _plot_array(anim_data)
+        
+        # Each frame is a single bar trace holding one row of the table
+        def frame_bar(i):
+            return go.Bar(x=values[i], y=categories, orientation='h', marker_color=colors,
+                          hovertemplate=f'{category_col}=%{{y}}<br>{date_col}={names[i]}<br>'
+                                        f'{value_col}=%{{x}}<extra></extra>')
+        
+        frames = [go.Frame(data=[frame_bar(i)], name=name) for i, name in enumerate(names)]
+        fig = go.Figure(data=[frame_bar(0)] if names else [], frames=frames)
+        
+        def animate_args(frame_duration, transition_duration):
+            return {'frame': {'duration': frame_duration, 'redraw': True}, 'mode': 'immediate',
+                    'fromcurrent': True, 'transition': {'duration': transition_duration, 'easing': 'linear'}}
+        
+        # Play/pause buttons and date slider, laid out as plotly express does
+        fig.update_layout(
+            title=title,
+            xaxis_title=value_col,
+            yaxis=dict(title=category_col, categoryorder='array', categoryarray=list(categories[::-1])),
+            updatemenus=[dict(type='buttons', direction='left', showactive=False,
+                              x=0.1, xanchor='right', y=0, yanchor='top', pad={'r': 10, 't': 70},
+                              buttons=[dict(label='&#9654;', method='animate', args=[None, animate_args(1000, 300)]),
+                                       dict(label='&#9724;', method='animate', args=[[None], animate_args(0, 0)])])],
+            sliders=[dict(active=0, currentvalue={'prefix': f'{date_col}='}, len=0.9, pad={'b': 10, 't': 60},
+                          steps=[dict(label=name, method='animate', args=[[name], animate_args(0, 0)])
+                                 for name in names])]
+        )
         
         return fig
     
@@ -227,11 +393,11 @@ class ChartGenerator:
             raise ValueError("No data provided")
         
         fig = go.Figure(data=go.Candlestick(
-            x=self.data[date_col],
-            open=self.data[open_col],
-            high=self.data[high_col],
-            low=self.data[low_col],
-            close=self.data[close_col]
+            x=self.data[date_col].to_numpy(),
+            open=_plot_array(self.data[open_col]),
+            high=_plot_array(self.data[high_col]),
+            low=_plot_array(self.data[low_col]),
+            close=_plot_array(self.data[close_col])
         ))
         
         fig.update_layout(
@@ -268,8 +434,52 @@ class ChartGenerator:
     def save_chart(self, fig, filename, format='html'):
         """Save chart to file with multiple format support"""
         os.makedirs(CHARTS_DIR, exist_ok=True)
-        filepath = os.path.join(CHARTS_DIR, f"{filename}.{format}")
+        self._write_chart(fig, os.path.join(CHARTS_DIR, f"{filename}.{format}"), format)
+    
+    def save_charts(self, charts, format='html', workers=None):
+        """
+        Save several charts to files at once
+        
+        HTML files are written from a thread pool, so serializing one chart
+        overlaps with writing the others to disk. Plotly images are exported
+        through one plotly.io.write_images call when the installed Plotly has
+        it, which renders every chart in a single Kaleido browser session
+        instead of starting one per chart.
         
+        Args:
+            charts: Iterable of (figure, filename) pairs, filenames without extension
+            format: File format for every chart ('html', 'png', 'jpg', 'pdf' or 'svg')
+            workers: Number of writer threads (defaults to the CPU count)
+        """
+        os.makedirs(CHARTS_DIR, exist_ok=True)
+        charts = [(fig, os.path.join(CHARTS_DIR, f"{filename}.{format}")) for fig, filename in charts]
+        
+        if format != 'html':
+            import plotly.io as pio
+            plotly_charts = [(fig, filepath) for fig, filepath in charts if hasattr(fig, 'write_image')]
+            if len(plotly_charts) > 1 and hasattr(pio, 'write_images'):
+                try:
+                    pio.write_images([fig for fig, _ in plotly_charts],
+                                     [filepath for _, filepath in plotly_charts], format=format)
+                    for _, filepath in plotly_charts:
+                        print(f"Chart saved: {filepath}")
+                except Exception as e:
+                    print(f"Error saving charts: {e}")
+                charts = [(fig, filepath) for fig, filepath in charts if not hasattr(fig, 'write_image')]
+            
+            # Matplotlib and the older single-process Kaleido are not thread-safe
+            for fig, filepath in charts:
+                self._write_chart(fig, filepath, format)
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count(), thread_name_prefix='chart-io') as pool:
+            for fig, filepath in charts:
+                pool.submit(self._write_chart, fig, filepath, format)
+    
+    @staticmethod
+    def _write_chart(fig, filepath, format):
+        """Write one chart to filepath, reporting the outcome"""
         try:
             if hasattr(fig, 'write_html'):  # Plotly figure
                 if format == 'html':
@@ -284,30 +494,65 @@ class ChartGenerator:
         except Exception as e:
             print(f"Error saving chart: {e}")
 
+def _seasonal_decompose(values, period):
+    """
+    Additive decomposition of a 1-D array, as statsmodels' seasonal_decompose computes it
+    
+    The trend is a centred moving average over one period (half weights at
+    both ends when the period is even) and is NaN where the window does not
+    fit. The seasonal component is the mean detrended value of each phase of
+    the period, centred on zero.
+    
+    Returns:
+        tuple: trend, seasonal and residual arrays, each the length of values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    nobs = len(values)
+    if np.isnan(values).any():
+        raise ValueError("This function does not handle missing values")
+    if nobs < 2 * period:
+        raise ValueError(f"x must have 2 complete cycles requires {2 * period} observations. x only has {nobs} observation(s)")
+    
+    if period % 2 == 0:
+        weights = np.array([0.5] + [1.0] * (period - 1) + [0.5]) / period
+    else:
+        weights = np.repeat(1.0 / period, period)
+    offset = len(weights) // 2
+    trend = np.full(nobs, np.nan)
+    trend[offset:nobs - offset] = np.convolve(values, weights, mode='valid')
+    
+    detrended = values - trend
+    phase = np.arange(nobs) % period
+    known = ~np.isnan(detrended)
+    period_averages = (np.bincount(phase[known], weights=detrended[known], minlength=period)
+                       / np.bincount(phase[known], minlength=period))
+    period_averages -= period_averages.mean()
+    seasonal = period_averages[phase]
+    
+    return trend, seasonal, detrended - seasonal
+
 class AdvancedAnalytics:
     """Advanced analytics and statistical analysis"""
     
     def __init__(self, data=None):
         self.data = data
+        self._groupbys = _GroupByCache()
     
     def calculate_seasonality(self, date_col='Date', value_col='Total_Sales', period=12):
         """Calculate seasonal patterns in sales data"""
         if self.data is None:
             return None
         
-        from scipy import signal
-        
         # Prepare time series data
-        ts_data = self.data.groupby(date_col)[value_col].sum().sort_index()
+        ts_data = self._groupbys.get(self.data, date_col)[value_col].sum().sort_index()
         
         # Decompose time series
-        from statsmodels.tsa.seasonal import seasonal_decompose
-        decomposition = seasonal_decompose(ts_data, period=period)
+        trend, seasonal, residual = _seasonal_decompose(ts_data.to_numpy(), period)
         
         return {
-            'trend': decomposition.trend,
-            'seasonal': decomposition.seasonal,
-            'residual': decomposition.resid,
+            'trend': pd.Series(trend, index=ts_data.index, name='trend'),
+            'seasonal': pd.Series(seasonal, index=ts_data.index, name='seasonal'),
+            'residual': pd.Series(residual, index=ts_data.index, name='resid'),
             'original': ts_data
         }
     
@@ -317,7 +562,7 @@ class AdvancedAnalytics:
             return None
         
         # Group by period
-        period_data = self.data.groupby(pd.Grouper(key=date_col, freq=period))[value_col].sum()
+        period_data = self._groupbys.get(self.data, date_col, freq=period)[value_col].sum()
         
         # Calculate growth rates
         growth_rates = period_data.pct_change() * 100
@@ -337,57 +582,106 @@ class AdvancedAnalytics:
         # Calculate RFM metrics
         current_date = self.data[date_col].max()
         
-        rfm = self.data.groupby(customer_col).agg({
-            date_col: lambda x: (current_date - x.max()).days,  # Recency
-            value_col: ['count', 'sum']  # Frequency, Monetary
+        # Built-in reductions only, so no Python function is called per customer
+        customers = self._groupbys.get(self.data, customer_col)
+        rfm = pd.DataFrame({
+            'Recency': (current_date - customers[date_col].max()).dt.days,
+            'Frequency': customers[value_col].count(),
+            'Monetary': customers[value_col].sum()
         }).round(2)
         
-        rfm.columns = ['Recency', 'Frequency', 'Monetary']
-        
         # Create RFM scores
-        rfm['R_Score'] = pd.qcut(rfm['Recency'], 5, labels=[5,4,3,2,1])
-        rfm['F_Score'] = pd.qcut(rfm['Frequency'].rank(method='first'), 5, labels=[1,2,3,4,5])
-        rfm['M_Score'] = pd.qcut(rfm['Monetary'], 5, labels=[1,2,3,4,5])
+        rfm['R_Score'] = self._quintile_scores(rfm['Recency'], reverse=True)
+        rfm['F_Score'] = self._quintile_scores(self._ordinal_ranks(rfm['Frequency']))
+        rfm['M_Score'] = self._quintile_scores(rfm['Monetary'])
         
-        rfm['RFM_Score'] = rfm['R_Score'].astype(str) + rfm['F_Score'].astype(str) + rfm['M_Score'].astype(str)
+        # Three digits, e.g. '545', built from one integer per customer
+        rfm['RFM_Score'] = (rfm['R_Score'].astype('Int16') * 100 + rfm['F_Score'] * 10 + rfm['M_Score']).astype(str)
         
         return rfm
     
+    @staticmethod
+    def _ordinal_ranks(values):
+        """
+        Rank values from 1 to n, ties in order of appearance, like values.rank(method='first')
+        
+        Args:
+            values (pd.Series): Values without missing entries to rank
+            
+        Returns:
+            pd.Series: int64 ranks
+        """
+        # A stable sort keeps tied values in their original order
+        order = np.argsort(values.to_numpy(), kind='stable')
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(1, len(order) + 1)
+        return pd.Series(ranks, index=values.index)
+    
+    @staticmethod
+    def _quintile_scores(values, reverse=False):
+        """
+        Score values from 1 to 5 by quintile, like pd.qcut(values, 5, labels=[1, 2, 3, 4, 5])
+        
+        Args:
+            values (pd.Series): Values to score
+            reverse (bool): Score the lowest quintile 5 instead of 1
+            
+        Returns:
+            pd.Series: int8 scores, or nullable Int8 with <NA> for missing values
+        """
+        array = values.to_numpy(dtype=np.float64)
+        # Same quintile edges as pd.qcut, which also fails on repeated edges
+        edges = np.nanpercentile(array, np.linspace(0, 1, 6) * 100)
+        if np.unique(edges).size < edges.size:
+            raise ValueError(f"Bin edges must be unique: {edges!r}")
+        
+        # Intervals are closed on the right, so a value on an edge takes the lower score
+        scores = np.searchsorted(edges[1:-1], array, side='left').astype(np.int8)
+        scores = 5 - scores if reverse else scores + 1
+        missing = np.isnan(array)
+        if missing.any():
+            return pd.Series(pd.arrays.IntegerArray(scores, missing), index=values.index)
+        return pd.Series(scores, index=values.index)
+    
     def forecast_sales(self, date_col='Date', value_col='Total_Sales', periods=30):
         """Simple sales forecasting using linear trend"""
         if self.data is None:
             return None
         
-        try:
-            from sklearn.linear_model import LinearRegression
-            import numpy as np
-            
-            # Prepare data
-            ts_data = self.data.groupby(date_col)[value_col].sum().sort_index()
-            
-            # Create features (days since start)
-            X = np.arange(len(ts_data)).reshape(-1, 1)
-            y = ts_data.values
-            
-            # Fit model
-            model = LinearRegression()
-            model.fit(X, y)
-            
-            # Make predictions
-            future_X = np.arange(len(ts_data), len(ts_data) + periods).reshape(-1, 1)
-            forecast = model.predict(future_X)
-            
-            # Create future dates
-            last_date = ts_data.index[-1]
-            future_dates = pd.date_range(start=last_date + pd.Timedelta(days=1), 
-                                       periods=periods, freq='D')
-            
-            return {
-                'historical': ts_data,
-                'forecast': pd.Series(forecast, index=future_dates),
-                'model_score': model.score(X, y)
-            }
-            
-        except ImportError:
-            print("scikit-learn not installed. Cannot perform forecasting.")
-            return None
\ No newline at end of file
+        # Prepare data
+        ts_data = self._groupbys.get(self.data, date_col)[value_col].sum().sort_index()
+        
+        # Features are the positions 0..n-1 (days since start), whose mean and
+        # variance are known, so the least-squares line has a closed form
+        n = len(ts_data)
+        X = np.arange(n)
+        y = ts_data.to_numpy(dtype=np.float64)
+        y_mean = y.mean()
+        x_mean = (n - 1) / 2
+        x_var = (n * n - 1) / 12
+        slope = np.dot(X - x_mean, y - y_mean) / n / x_var if n > 1 else 0.0
+        intercept = y_mean - slope * x_mean
+        
+        # Make predictions
+        forecast = slope * np.arange(n, n + periods) + intercept
+        
+        # Coefficient of determination of the fit, as LinearRegression.score; a
+        # series without variance scores 1.0 if fitted exactly, else 0.0, like r2_score
+        residuals = y - (slope * X + intercept)
+        ss_res = np.dot(residuals, residuals)
+        ss_tot = np.dot(y - y_mean, y - y_mean)
+        if ss_tot == 0:
+            model_score = 1.0 if ss_res == 0 else 0.0
+        else:
+            model_score = 1 - ss_res / ss_tot
+        
+        # Create future dates
+        last_date = ts_data.index[-1]
+        future_dates = pd.date_range(start=last_date + pd.Timedelta(days=1), 
+                                   periods=periods, freq='D')
+        
+        return {
+            'historical': ts_data,
+            'forecast': pd.Series(forecast, index=future_dates),
+            'model_score': model_score
+        }
\ No newline at end of file